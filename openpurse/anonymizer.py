@@ -1,9 +1,13 @@
 import hashlib
 import re
+import string
 from typing import Dict
 
 from lxml import etree
 
+from openpurse.parser import xml_parser
+from openpurse.validator import Validator
+
 
 class Anonymizer:
     """
@@ -11,6 +15,11 @@ class Anonymizer:
     Ensures structural and checksum validity for testing in non-prod environments.
     """
 
+    # Hex digit -> decimal digit (int(h, 16) % 10), and IBAN letter -> two digits (A=10 ... Z=35)
+    _hex_to_dec_table = str.maketrans("abcdef", "012345")
+    _hex_to_alpha_table = str.maketrans("0123456789abcdef", "ABCDEFGHIJKLMNOP")
+    _letter_digit_table = str.maketrans({c: str(ord(c) - 55) for c in string.ascii_uppercase})
+
     def __init__(self, salt: str = "openpurse-default-salt"):
         self.salt = salt
         self.salt_bytes = self.salt.encode()
@@ -30,8 +39,12 @@ class Anonymizer:
         if not original:
             return original
 
-        # Deterministic hash based on original string and salt
-        hash_val = hashlib.sha256(original.encode() + self.salt_bytes).hexdigest()[:8].upper()
+        # Deterministic hash based on original string and salt, memoised per instance since
+        # party names repeat heavily across a batch
+        hash_val = self._name_map.get(original)
+        if hash_val is None:
+            digest = hashlib.sha256(original.encode() + self.salt_bytes).hexdigest()
+            hash_val = self._name_map[original] = digest[:8].upper()
         if not prefix:
             return hash_val
         return f"{prefix}_{hash_val}"
@@ -43,6 +56,15 @@ class Anonymizer:
         if not iban:
             return iban
 
+        masked = self._account_map.get(iban)
+        if masked is None:
+            masked = self._account_map[iban] = self._compute_iban_mask(iban)
+        return masked
+
+    def _compute_iban_mask(self, iban: str) -> str:
+        """
+        Derives the masked IBAN for ``_mask_iban`` (uncached).
+        """
         # Clean the IBAN
         clean_iban = self._iban_clean_pattern.sub("", iban.upper())
         if len(clean_iban) < 15:
@@ -56,14 +78,21 @@ class Anonymizer:
 
         # Create a strictly numeric core of the correct length
         # Using a simple deterministic mapping from hash hex digits to dec digits
-        mask_core = "".join(str(int(hash_val[i], 16) % 10) for i in range(core_len))
+        mask_core = hash_val[:core_len].translate(Anonymizer._hex_to_dec_table)
+
+        # Where the country's registered BBAN needs letters (e.g. the GB bank code), swap
+        # those positions for hash-derived letters so the mask stays structurally valid
+        structure = Validator.bban_structure(country_code)
+        if structure is not None and structure[0] == len(clean_iban):
+            for start, end, kind in structure[1]:
+                if kind == "a":
+                    start, end = start - 4, end - 4
+                    letters = hash_val[start:end].translate(Anonymizer._hex_to_alpha_table)
+                    mask_core = mask_core[:start] + letters + mask_core[end:]
 
         # Now we need to find the 2 digits (pos 2,3) that make it valid
         # Rearranged: mask_core + country_code + "00"
-        temp_rearranged = mask_core + country_code + "00"
-
-        # Fast alphanumeric char conversion
-        numeric_str = "".join(str(ord(c) - 55) if c.isalpha() else c for c in temp_rearranged)
+        numeric_str = (mask_core + country_code + "00").translate(Anonymizer._letter_digit_table)
 
         check_digits = (98 - (int(numeric_str) % 97)) % 97
         if check_digits == 0:
@@ -77,7 +106,7 @@ class Anonymizer:
         Anonymizes PII in ISO 20022 XML data in a single optimized pass.
         """
         try:
-            tree = etree.fromstring(xml_data)
+            tree = etree.fromstring(xml_data, xml_parser())
         except Exception:
             return xml_data
 
@@ -1,5 +1,6 @@
 from dataclasses import fields
-from typing import Any, Type
+from functools import lru_cache
+from typing import Any, FrozenSet, Type
 
 from openpurse.models import (
     Camt004Message,
@@ -14,6 +15,14 @@ from openpurse.models import (
 )
 
 
+@lru_cache(maxsize=None)
+def _field_names(message_class: Type[PaymentMessage]) -> FrozenSet[str]:
+    """
+    Returns the init field names of a message dataclass, introspected once per class.
+    """
+    return frozenset(f.name for f in fields(message_class))
+
+
 class MessageBuilder:
     """
     A factory for programmatically building typed OpenPurse payment messages.
@@ -50,8 +59,8 @@ class MessageBuilder:
         # Determine the target dataclass
         target_class: Type[PaymentMessage] = MessageBuilder._SCHEMA_MAP.get(schema, PaymentMessage)
 
-        # Introspect the allowed fields from the dataclass
-        valid_fields = {f.name for f in fields(target_class)}
+        # Introspect the allowed fields from the dataclass (cached per class)
+        valid_fields = _field_names(target_class)
 
         # Filter kwargs to only include valid fields
         filtered_kwargs = {k: v for k, v in kwargs.items() if k in valid_fields}
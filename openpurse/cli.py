@@ -1,7 +1,7 @@
 import argparse
 import sys
 import json
-from typing import Optional
+from typing import List, Optional
 
 from openpurse.parser import OpenPurseParser
 from openpurse.validator import Validator
@@ -82,7 +82,13 @@ def handle_persist(args):
         print(f"Error persisting message: {e}", file=sys.stderr)
         sys.exit(1)
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    """
+    Runs the OpenPurse CLI.
+
+    Args:
+        argv: Command-line arguments without the program name; defaults to ``sys.argv[1:]``.
+    """
     parser = argparse.ArgumentParser(
         prog="openpurse",
         description="OpenPurse CLI - High-performance financial message processing tool."
@@ -105,7 +111,7 @@ def main():
     persist_parser.add_argument("--db-url", required=True, help="SQLAlchemy database URL (e.g. sqlite:///test.db).")
     persist_parser.set_defaults(func=handle_persist)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     args.func(args)
 
 if __name__ == "__main__":
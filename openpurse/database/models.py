@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Table
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 class Base(DeclarativeBase):
@@ -32,6 +34,11 @@ class PaymentMessageRecord(Base):
     
     debtor_address: Mapped[Optional[dict]] = mapped_column(JSON)
     creditor_address: Mapped[Optional[dict]] = mapped_column(JSON)
+
+    # Denormalised from debtor_address (which stays the source of truth) so location
+    # filters hit an index instead of extracting from the JSON blob row by row
+    debtor_town: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+    debtor_country: Mapped[Optional[str]] = mapped_column(String(2), index=True)
     
     debtor_account: Mapped[Optional[str]] = mapped_column(String(255))
     creditor_account: Mapped[Optional[str]] = mapped_column(String(255))
@@ -104,3 +111,45 @@ class Camt054Record(PaymentMessageRecord):
     __mapper_args__ = {
         "polymorphic_identity": "camt.054",
     }
+
+# Columns added to payment_messages after its first release, derived from debtor_address
+_DEBTOR_LOCATION_COLUMNS = ("debtor_town", "debtor_country")
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Upgrades a database created from an older OpenPurse schema in place.
+
+    Adds the debtor_town/debtor_country columns and their indexes to an existing
+    payment_messages table and backfills them from debtor_address. Databases created
+    with Base.metadata.create_all are already current, and running it twice is a no-op.
+    """
+    table = PaymentMessageRecord.__table__
+    with engine.begin() as conn:
+        if not inspect(conn).has_table(table.name):
+            return
+        existing = {column["name"] for column in inspect(conn).get_columns(table.name)}
+        missing = [table.c[name] for name in _DEBTOR_LOCATION_COLUMNS if name not in existing]
+        if not missing:
+            return
+
+        for column in missing:
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+        for index in table.indexes:
+            if any(column in missing for column in index.columns):
+                index.create(conn, checkfirst=True)
+
+        rows = [
+            {"row_id": row_id, "town": address.get("town_name"), "country": address.get("country")}
+            for row_id, address in conn.execute(
+                select(table.c.id, table.c.debtor_address).where(table.c.debtor_address.isnot(None))
+            )
+            if address
+        ]
+        if rows:
+            conn.execute(
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(debtor_town=bindparam("town"), debtor_country=bindparam("country")),
+                rows,
+            )
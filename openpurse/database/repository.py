@@ -1,6 +1,6 @@
 import dataclasses
-from typing import Any, Dict, List, Optional, Type, Union
-from sqlalchemy import select
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from openpurse.models import PaymentMessage, Pacs008Message, Pain001Message, Camt054Message
 from openpurse.database.models import (
@@ -28,6 +28,46 @@ class MessageRepository:
         self.session.flush()  # Ensure ID is populated
         return record
 
+    def save_many(self, msgs: Iterable[PaymentMessage]) -> List[PaymentMessageRecord]:
+        """
+        Persists a batch of PaymentMessage dataclasses with a single flush.
+
+        Records of the same polymorphic type are written together, so SQLAlchemy can
+        batch their INSERTs instead of issuing one round-trip per message.
+
+        Args:
+            msgs: The messages to persist, in any mix of supported message types.
+
+        Returns:
+            The persisted records, in input order, with their IDs populated.
+        """
+        records = [self._to_record(msg) for msg in msgs]
+        if records:
+            self.session.add_all(records)
+            self.session.flush()  # Ensure IDs are populated
+        return records
+
+    def insert_many(self, msgs: Iterable[PaymentMessage]) -> int:
+        """
+        Bulk-inserts messages through SQLAlchemy's executemany INSERT path.
+
+        Unlike ``save_many``, no ORM record objects are built or tracked by the session, so
+        this is the faster choice for write-only ingestion where the records aren't needed.
+
+        Args:
+            msgs: The messages to persist, in any mix of supported message types.
+
+        Returns:
+            The number of messages inserted.
+        """
+        rows_by_class: Dict[Type[PaymentMessageRecord], List[Dict[str, Any]]] = {}
+        for msg in msgs:
+            rows_by_class.setdefault(self._record_class(msg), []).append(self._to_row(msg))
+
+        for record_class, rows in rows_by_class.items():
+            self.session.execute(insert(record_class), rows)
+        return sum(len(rows) for rows in rows_by_class.values())
+
     def get_by_message_id(self, message_id: str) -> Optional[PaymentMessageRecord]:
         """
         Retrieves a message record by its ISO/MT message ID.
@@ -42,22 +82,47 @@ class MessageRepository:
         stmt = select(PaymentMessageRecord).where(PaymentMessageRecord.sender_bic == sender_bic)
         return list(self.session.execute(stmt).scalars().all())
 
+    def list_by_debtor_location(
+        self, country: str, town: Optional[str] = None
+    ) -> List[PaymentMessageRecord]:
+        """
+        Lists all messages whose debtor is based in a given country (and, optionally, town).
+        """
+        stmt = select(PaymentMessageRecord).where(PaymentMessageRecord.debtor_country == country)
+        if town is not None:
+            stmt = stmt.where(PaymentMessageRecord.debtor_town == town)
+        return list(self.session.execute(stmt).scalars().all())
+
     def _to_record(self, msg: PaymentMessage) -> PaymentMessageRecord:
         """
         Internal mapping logic from dataclass to relational record.
         """
-        data = dataclasses.asdict(msg)
-        
-        # Handle polymorphic identities
+        return self._record_class(msg)(**self._to_row(msg))
+
+    @staticmethod
+    def _to_row(msg: PaymentMessage) -> Dict[str, Any]:
+        """
+        Flattens a message into column values, including the denormalised debtor location.
+        """
+        row = dataclasses.asdict(msg)
+        debtor_address = row.get("debtor_address") or {}
+        row["debtor_town"] = debtor_address.get("town_name")
+        row["debtor_country"] = debtor_address.get("country")
+        return row
+
+    @staticmethod
+    def _record_class(msg: PaymentMessage) -> Type[PaymentMessageRecord]:
+        """
+        Resolves the polymorphic record class that stores a given message type.
+        """
         if isinstance(msg, Pacs008Message):
-            # Flatten or remove complex fields that handled separately in the model
-            return Pacs008Record(**data)
+            return Pacs008Record
         elif isinstance(msg, Pain001Message):
-            return Pain001Record(**data)
+            return Pain001Record
         elif isinstance(msg, Camt054Message):
-            return Camt054Record(**data)
-        
-        return PaymentMessageRecord(**data)
+            return Camt054Record
+
+        return PaymentMessageRecord
 
     @staticmethod
     def create_schema(engine) -> None:
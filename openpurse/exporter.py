@@ -1,5 +1,7 @@
+import copy
 import json
 from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from typing import Any, Dict, Union, get_args, get_origin
 
 try:
@@ -8,6 +10,13 @@ try:
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 from openpurse import models
 
 
@@ -54,10 +63,22 @@ class Exporter:
     def generate_schema(model_class: Any) -> Dict[str, Any]:
         """
         Generates a JSON Schema component for a given dataclass.
+
+        The schema is derived once per class; each call returns a fresh copy, so callers
+        may mutate the result freely.
         """
         if not is_dataclass(model_class):
             raise ValueError(f"{model_class} is not a dataclass")
 
+        return copy.deepcopy(Exporter._schema(model_class))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _schema(model_class: Any) -> Dict[str, Any]:
+        """
+        Builds the JSON Schema component for a dataclass. The result is cached and shared,
+        so it must never be mutated; public callers get a copy via ``generate_schema``.
+        """
         properties = {}
         required = []
 
@@ -85,6 +106,17 @@ class Exporter:
     def to_openapi() -> Dict[str, Any]:
         """
         Generates a complete OpenAPI 3.0.0 specification for all OpenPurse models.
+
+        The specification is assembled once; each call returns a fresh copy.
+        """
+        return copy.deepcopy(Exporter._openapi_spec())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _openapi_spec() -> Dict[str, Any]:
+        """
+        Assembles the OpenAPI specification. The result is cached and shared, so it must
+        never be mutated; public callers get a copy via ``to_openapi``.
         """
         # List of models to include in the spec
         model_classes = [
@@ -103,7 +135,7 @@ class Exporter:
 
         schemas = {}
         for model in model_classes:
-            schemas[model.__name__] = Exporter.generate_schema(model)
+            schemas[model.__name__] = Exporter._schema(model)
 
         spec = {
             "openapi": "3.0.0",
@@ -116,14 +148,20 @@ class Exporter:
             "paths": {},  # Path definitions are not applicable for a library, but required for valid OpenAPI
         }
 
-        return spec
+        # Deep-copied once here so the spec never aliases the per-class schema cache
+        return copy.deepcopy(spec)
 
     @staticmethod
     def export_json(path: str) -> None:
         """
         Saves the OpenAPI spec to a JSON file.
         """
-        spec = Exporter.to_openapi()
+        spec = Exporter._openapi_spec()  # Read-only here, so the shared copy is enough
+        if HAS_ORJSON:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
+            return
+
         with open(path, "w") as f:
             json.dump(spec, f, indent=2)
 
@@ -136,6 +174,6 @@ class Exporter:
             raise ImportError(
                 "PyYAML is required for YAML export. Install it with 'pip install PyYAML'."
             )
-        spec = Exporter.to_openapi()
+        spec = Exporter._openapi_spec()  # Read-only here, so the shared copy is enough
         with open(path, "w") as f:
             yaml.dump(spec, f, sort_keys=False)
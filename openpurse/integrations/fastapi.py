@@ -13,8 +13,14 @@ async def get_openpurse_message(request: Request) -> PydanticPaymentMessage:
     if not body:
         raise HTTPException(status_code=400, detail="Empty payload")
 
-    # 1. Pre-validate schema if it's XML
-    report = Validator.validate_schema(body)
+    # 1. Pre-validate schema. Validator.validate_schema would build an OpenPurseParser for
+    # XML anyway, so XML builds it here instead and keeps the tree for extraction below.
+    parser = None
+    if Validator.detect_format(body) == "xml":
+        parser = OpenPurseParser(body)
+        report = parser.validate_schema()
+    else:
+        report = Validator.validate_schema(body)
     if not report.is_valid:
         raise HTTPException(
             status_code=422, 
@@ -22,7 +28,8 @@ async def get_openpurse_message(request: Request) -> PydanticPaymentMessage:
         )
 
     # 2. Parse payload
-    parser = OpenPurseParser(body)
+    if parser is None:
+        parser = OpenPurseParser(body)
     try:
         msg = parser.parse_detailed()
         
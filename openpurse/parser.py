@@ -1,6 +1,9 @@
 import glob
 import os
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+import re
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
 
 from lxml import etree
 
@@ -31,6 +34,120 @@ from openpurse.models import (
 if TYPE_CHECKING:
     from openpurse.models import ValidationReport
 
+# Per-thread parser for inbound messages, see xml_parser()
+_PARSER_LOCAL = threading.local()
+
+# ISO 20022 message dialect as it appears in namespaces, e.g. "pacs.008" in "...xsd:pacs.008.001.08"
+_DIALECT_PATTERN = re.compile(r"[a-z]{4}\.[0-9]{3}")
+
+# MT field ":TAG:" at a line start; the value runs across lines (e.g. :50K:) up to the next
+# field, the block 4 "-" trailer or the end of the message
+_MT_FIELD_PATTERN = re.compile(
+    r"^:([0-9A-Z]{2,3}):(.*?)(?=\r?\n:[0-9A-Z]{2,3}:|\r?\n-|\Z)", re.MULTILINE | re.DOTALL
+)
+
+# MT header and statement patterns, compiled once rather than looked up in re's cache per call
+_MT_B1_BIC_PATTERN = re.compile(r"\{1:F01([A-Z0-9]{12,14})")
+_MT_B1_BIC_SEQ_PATTERN = re.compile(r"\{1:F01([A-Z0-9]{8,14}?)(?=[0-9]{10}\})")
+_MT_B1_BIC_LOOSE_PATTERN = re.compile(r"\{1:F01([A-Z0-9]{8,14})")
+_MT_B2_PATTERN = re.compile(r"\{2:[IO]([0-9]{3})([A-Z0-9]{12})")
+_MT_B2_LOOSE_PATTERN = re.compile(r"\{2:[IO]([0-9]{3})([A-Z0-9]{8,14})")
+_MT_UETR_PATTERN = re.compile(r"\{3:.*\{121:(.*?)\}.*?\}")
+_MT_B4_PATTERN = re.compile(r"\{4:(.*?)-}", re.DOTALL)
+_MT_STATEMENT_FIELD_PATTERN = re.compile(
+    r"\n:([0-9]{2}[A-Z]?):(.*?)(?=\n:[0-9]{2}[A-Z]?:|\n-\Z|\n-\})", re.DOTALL
+)
+_MT_61_AMOUNT_PATTERN = re.compile(r"([A-Z]{1,2})([0-9]+,[0-9]*)")
+
+# Compiled XMLSchema objects are shared across parsers; validate() and its error_log are
+# per-schema state, so they are used under this lock
+_SCHEMA_LOCK = threading.Lock()
+
+# Message root element -> dialect, for documents that arrive without a namespace
+_ROOT_TAG_DIALECTS: Dict[str, str] = {
+    "CstmrPmtStsRpt": "pain.002",
+    "CstmrCdtTrfInitn": "pain.001",
+    "CstmrDrctDbtInitn": "pain.008",
+    "BkToCstmrAcctRpt": "camt.052",
+    "BkToCstmrStmt": "camt.053",
+    "BkToCstmrDbtCdtNtfctn": "camt.054",
+    "FIToFICstmrCdtTrf": "pacs.008",
+    "RtrAcct": "camt.004",
+    "FXTradInstr": "fxtr.014",
+    "SctiesSttlmTxInstr": "sese.023",
+    "PmtRtr": "pacs.004",
+    "FICdtTrf": "pacs.009",
+    "RedOrdr": "setr.004",
+    "SbcptOrdr": "setr.010",
+    "AcctOpngReq": "acmt.007",
+    "AcctExcldMndtMntncReq": "acmt.015",
+    "BkSrvcsBllgStmt": "camt.086",
+}
+
+
+# Namespace-agnostic envelope paths, evaluated on every document that carries an AppHdr
+_APP_HDR_XPATH = etree.XPath(".//*[local-name()='AppHdr']")
+_DOCUMENT_XPATH = etree.XPath(".//*[local-name()='Document']")
+
+# Business Application Header fields, as explicit child paths so no full tree scan is needed
+_BAH_FIELD_XPATHS: Dict[str, etree.XPath] = {
+    "sender_bic": etree.XPath(
+        "./*[local-name()='Fr']/*[local-name()='FIId']/*[local-name()='FinInstnId']"
+        "/*[local-name()='BICFI']/text()"
+    ),
+    "receiver_bic": etree.XPath(
+        "./*[local-name()='To']/*[local-name()='FIId']/*[local-name()='FinInstnId']"
+        "/*[local-name()='BICFI']/text()"
+    ),
+    "message_id": etree.XPath("./*[local-name()='BizMsgIdr']/text()"),
+}
+
+
+def xml_parser() -> etree.XMLParser:
+    """
+    Returns this thread's hardened XMLParser, creating it on first use.
+
+    Every OpenPurse component that parses inbound XML (the parser, the anonymizer) should
+    pass this to ``etree.fromstring`` so they all share the same locked-down settings.
+
+    Inbound messages never need DTD entities, network fetches or an xml:id index, so the
+    parser skips building them (and closes the XXE door while at it). lxml locks a parser
+    for the duration of each parse, so one instance per thread lets parses on different
+    threads run concurrently instead of queueing on a single process-wide parser.
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = etree.XMLParser(
+            resolve_entities=False, no_network=True, collect_ids=False
+        )
+    return parser
+
+
+@lru_cache(maxsize=64)
+def _compiled_schema(xsd_path: str) -> etree.XMLSchema:
+    """
+    Loads and compiles a registered XSD once per process.
+
+    Compiling an ISO 20022 schema costs milliseconds (~5ms for pacs.008), far more than
+    validating a typical message against it, so repeated validate_schema() calls reuse it.
+    """
+    with open(xsd_path, "rb") as f:
+        return etree.XMLSchema(etree.XML(f.read()))
+
+
+@lru_cache(maxsize=2048)
+def _compiled_xpath(xpath_expr: str, namespace: Optional[str]) -> etree.XPath:
+    """
+    Compiles an ``ns:``-prefixed extraction path once per (path, namespace) pair.
+
+    The parser probes every document with the same few hundred fixed paths, so reusing
+    the compiled ``etree.XPath`` skips re-parsing the expression on each lookup. Documents
+    without a namespace get the path with its ``ns:`` prefixes stripped.
+    """
+    if namespace is None:
+        return etree.XPath(xpath_expr.replace("ns:", ""))
+    return etree.XPath(xpath_expr, namespaces={"ns": namespace})
+
 
 class OpenPurseParser:
     """
@@ -89,7 +206,7 @@ class OpenPurseParser:
 
         if not self.is_mt:
             try:
-                self.tree = etree.fromstring(self.message_data)
+                self.tree = etree.fromstring(self.message_data, xml_parser())
                 self.nsmap = self.tree.nsmap
 
                 # Extract default namespace if exists
@@ -105,7 +222,15 @@ class OpenPurseParser:
                 # --- BAH (head.001) Integration ---
                 # Detect if the root is a BAH or a wrapper containing a BAH
                 is_bah = "head.001" in (self.default_ns or "")
-                app_hdr_nodes = self.tree.xpath(".//*[local-name()='AppHdr']")
+                # A C-level byte scan rules out the tree-wide AppHdr search for plain
+                # Documents (the common case); wide encodings (NUL in the first code unit)
+                # can't be scanned as ASCII, so they always take the XPath route
+                data = self.message_data
+                app_hdr_nodes = (
+                    _APP_HDR_XPATH(self.tree)
+                    if b"AppHdr" in data or b"\x00" in data[:4]
+                    else []
+                )
 
                 if is_bah or app_hdr_nodes:
                     app_hdr = (
@@ -117,7 +242,7 @@ class OpenPurseParser:
                         self.bah_data = self._parse_bah(app_hdr)
 
                     # Pivot context to the Document if it exists
-                    doc_nodes = self.tree.xpath(".//*[local-name()='Document']")
+                    doc_nodes = _DOCUMENT_XPATH(self.tree)
                     if doc_nodes:
                         self.tree = doc_nodes[0]
                         self.nsmap = self.tree.nsmap
@@ -135,20 +260,15 @@ class OpenPurseParser:
         Extracts core routing information from an ISO 20022 Business Application Header.
         """
 
-        def find_text(xpath: str) -> Optional[str]:
-            res = app_hdr.xpath(xpath)
+        def find_text(xpath: etree.XPath) -> Optional[str]:
+            res = xpath(app_hdr)
             if res:
                 if isinstance(res[0], str):
                     return res[0].strip()
                 return res[0].text.strip() if hasattr(res[0], "text") and res[0].text else None
             return None
 
-        # Optimized explicitly defined paths to prevent O(N) full tree scanning
-        return {
-            "sender_bic": find_text("./*[local-name()='Fr']/*[local-name()='FIId']/*[local-name()='FinInstnId']/*[local-name()='BICFI']/text()"),
-            "receiver_bic": find_text("./*[local-name()='To']/*[local-name()='FIId']/*[local-name()='FinInstnId']/*[local-name()='BICFI']/text()"),
-            "message_id": find_text("./*[local-name()='BizMsgIdr']/text()"),
-        }
+        return {field: find_text(xpath) for field, xpath in _BAH_FIELD_XPATHS.items()}
 
     def validate_schema(self) -> "ValidationReport":
         """
@@ -189,15 +309,12 @@ class OpenPurseParser:
             )
 
         try:
-            with open(xsd_path, "rb") as f:
-                schema_root = etree.XML(f.read())
-                schema = etree.XMLSchema(schema_root)
+            schema = _compiled_schema(xsd_path)
+            with _SCHEMA_LOCK:
+                is_valid = schema.validate(self.tree)
+                errors = [] if is_valid else [str(err) for err in schema.error_log]
 
-            if schema.validate(self.tree):
-                return ValidationReport(is_valid=True, errors=[])
-            else:
-                errors = [str(err) for err in schema.error_log]
-                return ValidationReport(is_valid=False, errors=errors)
+            return ValidationReport(is_valid=is_valid, errors=errors)
 
         except etree.XMLSchemaParseError as e:
             return ValidationReport(
@@ -214,11 +331,7 @@ class OpenPurseParser:
             return None
 
         try:
-            if not self.default_ns:
-                xpath_expr = xpath_expr.replace("ns:", "")
-                result = element.xpath(xpath_expr)
-            else:
-                result = element.xpath(xpath_expr, namespaces=self.ns)
+            result = _compiled_xpath(xpath_expr, self.default_ns or None)(element)
             return result[0].strip() if result else None
         except IndexError:
             return None
@@ -227,11 +340,7 @@ class OpenPurseParser:
         if self.tree is None:
             return None
         try:
-            if not self.default_ns:
-                xpath_expr = xpath_expr.replace("ns:", "")
-                el = self.tree.xpath(xpath_expr)
-            else:
-                el = self.tree.xpath(xpath_expr, namespaces=self.ns)
+            el = _compiled_xpath(xpath_expr, self.default_ns or None)(self.tree)
 
             if el:
                 # If the result of xpath is a string (like from /text() or /@attr), return it directly
@@ -248,18 +357,17 @@ class OpenPurseParser:
         """
         Parses SWIFT MT format (like MT103, MT202).
         """
-        import re
-
         text = self.message_data.decode("utf-8", errors="ignore")
 
+        # Tokenise every field in one pass; the first occurrence of a tag wins
+        fields: Dict[str, str] = {}
+        for field in _MT_FIELD_PATTERN.finditer(text):
+            fields.setdefault(field.group(1), field.group(2))
+
         # Helper to extract from tags like :20:
         def extract_tag(tag: str) -> Optional[str]:
-            # Match from the tag until the next tag (newline followed by colon and 2-3 alphanumeric chars and a colon) or the end block '-'
-            # We must use DOTALL and we MUST ensure it matches across newlines for things like :50K:
-            match = re.search(
-                rf"^{tag}(.*?)(?=\r?\n:[0-9A-Z]{{2,3}}:|\r?\n-|\Z)", text, re.MULTILINE | re.DOTALL
-            )
-            return match.group(1).strip() if match else None
+            value = fields.get(tag[1:-1])
+            return value.strip() if value is not None else None
 
         # 1. Header parsing (Sender / Receiver BIC)
         # Block 1 Basic Header: {1:F01<BIC12><Session4><Seq6>}
@@ -267,18 +375,18 @@ class OpenPurseParser:
         sender = None
         
         # Extract 12 to 14 characters for the Sender BIC, trimming trailing zero-padding if present.
-        b1_match = re.search(r"\{1:F01([A-Z0-9]{12,14})", text)
+        b1_match = _MT_B1_BIC_PATTERN.search(text)
         if b1_match:
             sender = b1_match.group(1)[:14]
             if sender.endswith("00"):
                 sender = sender[:-2]
 
         # Fallback extract for 8-14 chars avoiding sequence numbers
-        b1_match = re.search(r"\{1:F01([A-Z0-9]{8,14}?)(?=[0-9]{10}\})", text)
+        b1_match = _MT_B1_BIC_SEQ_PATTERN.search(text)
         if b1_match:
             sender = b1_match.group(1)
         else:  # fallback
-            b1_match2 = re.search(r"\{1:F01([A-Z0-9]{8,14})", text)
+            b1_match2 = _MT_B1_BIC_LOOSE_PATTERN.search(text)
             if b1_match2:
                 sender = b1_match2.group(1)[:12]
         
@@ -290,12 +398,12 @@ class OpenPurseParser:
         # receiver BIC is 12 chars, followed by message priority 'N', 'U', 'S'.
         receiver = None
         mt_type = None
-        b2_match = re.search(r"\{2:[IO]([0-9]{3})([A-Z0-9]{12})", text)
+        b2_match = _MT_B2_PATTERN.search(text)
         if b2_match:
             mt_type = b2_match.group(1)
             receiver = b2_match.group(2)
         else:
-            b2_match2 = re.search(r"\{2:[IO]([0-9]{3})([A-Z0-9]{8,14})", text)
+            b2_match2 = _MT_B2_LOOSE_PATTERN.search(text)
             if b2_match2:
                 mt_type = b2_match2.group(1)
                 receiver = b2_match2.group(2)[:12]
@@ -305,7 +413,7 @@ class OpenPurseParser:
 
         # Block 3: {3:{121:[UUIDv4 UETR]}}
         uetr = None
-        b3_match = re.search(r"\{3:.*\{121:(.*?)\}.*?\}", text)
+        b3_match = _MT_UETR_PATTERN.search(text)
         if b3_match:
             uetr = b3_match.group(1).strip()
 
@@ -361,16 +469,12 @@ class OpenPurseParser:
             account_id = extract_tag(":25:")
 
             entries = []
-            block4_match = re.search(r"\{4:(.*?)-}", text, re.DOTALL)
+            block4_match = _MT_B4_PATTERN.search(text)
             if block4_match:
                 b4_text = block4_match.group(1)
 
                 # Extract all tag-value pairs
-                tag_matches = re.finditer(
-                    r"\n:([0-9]{2}[A-Z]?):(.*?)(?=\n:[0-9]{2}[A-Z]?:|\n-\Z|\n-\})",
-                    "\n" + b4_text.strip() + "\n-}",
-                    re.DOTALL,
-                )
+                tag_matches = _MT_STATEMENT_FIELD_PATTERN.finditer("\n" + b4_text.strip() + "\n-}")
 
                 current_entry = None
                 for m in tag_matches:
@@ -381,7 +485,7 @@ class OpenPurseParser:
                         if current_entry:
                             entries.append(current_entry)
 
-                        cd_match = re.search(r"([A-Z]{1,2})([0-9]+,[0-9]*)", val)
+                        cd_match = _MT_61_AMOUNT_PATTERN.search(val)
                         cd_ind = "CRDT"
                         amount_str = "0.00"
                         ref = "NONREF"
@@ -503,18 +607,12 @@ class OpenPurseParser:
     def _get_nodes(self, xpath_expr: str) -> list:
         if self.tree is None:
             return []
-        if not self.default_ns:
-            xpath_expr = xpath_expr.replace("ns:", "")
-            return self.tree.xpath(xpath_expr)
-        return self.tree.xpath(xpath_expr, namespaces=self.ns)
+        return _compiled_xpath(xpath_expr, self.default_ns or None)(self.tree)
 
     def _get_nodes_from(self, element: Any, xpath_expr: str) -> list:
         if element is None:
             return []
-        if not self.default_ns:
-            xpath_expr = xpath_expr.replace("ns:", "")
-            return element.xpath(xpath_expr)
-        return element.xpath(xpath_expr, namespaces=self.ns)
+        return _compiled_xpath(xpath_expr, self.default_ns or None)(element)
 
     def _parse_address(self, parent_element: Any) -> Optional[PostalAddress]:
         """
@@ -571,75 +669,14 @@ class OpenPurseParser:
             root_tag = self.tree[0].tag
             if "}" in root_tag:
                 root_tag = root_tag.split("}", 1)[1]
-            tag_mapping = {
-                "CstmrPmtStsRpt": "pain.002",
-                "CstmrCdtTrfInitn": "pain.001",
-                "CstmrDrctDbtInitn": "pain.008",
-                "BkToCstmrAcctRpt": "camt.052",
-                "BkToCstmrStmt": "camt.053",
-                "BkToCstmrDbtCdtNtfctn": "camt.054",
-                "FIToFICstmrCdtTrf": "pacs.008",
-                "RtrAcct": "camt.004",
-                "FXTradInstr": "fxtr.014",
-                "SctiesSttlmTxInstr": "sese.023",
-                "PmtRtr": "pacs.004",
-                "FICdtTrf": "pacs.009",
-                "RedOrdr": "setr.004",
-                "SbcptOrdr": "setr.010",
-                "AcctOpngReq": "acmt.007",
-                "AcctExcldMndtMntncReq": "acmt.015",
-                "BkSrvcsBllgStmt": "camt.086",
-            }
-            ns_str = tag_mapping.get(root_tag, "")
+            ns_str = _ROOT_TAG_DIALECTS.get(root_tag, "")
 
         base_msg = self.parse()
 
-        if "camt.054" in ns_str:
-            return self._parse_camt054_detailed(base_msg)
-        elif "pacs.008" in ns_str:
-            return self._parse_pacs008_detailed(base_msg)
-        elif "camt.004" in ns_str:
-            return self._parse_camt004_detailed(base_msg)
-        elif "camt.052" in ns_str or "camt.053" in ns_str:
-            return self._parse_camt05X_detailed(base_msg, ns_str)
-        elif "pain.001" in ns_str or "pain.008" in ns_str:
-            return self._parse_pain00X_detailed(base_msg, ns_str)
-        elif "pain.002" in ns_str:
-            return self._parse_pain002_detailed(base_msg)
-
-        # Fallback to base
-        if "camt.056" in ns_str:
-            return self._parse_camt056()
-
-        if "camt.029" in ns_str:
-            return self._parse_camt029()
-
-        if "fxtr.014" in ns_str:
-            return self._parse_fxtr014(base_msg)
-
-        if "sese.023" in ns_str:
-            return self._parse_sese023(base_msg)
-
-        if "pacs.004" in ns_str:
-            return self._parse_pacs004(base_msg)
-
-        if "pacs.009" in ns_str:
-            return self._parse_pacs009(base_msg)
-
-        if "setr.004" in ns_str:
-            return self._parse_setr004(base_msg)
-
-        if "setr.010" in ns_str:
-            return self._parse_setr010(base_msg)
-
-        if "acmt.007" in ns_str:
-            return self._parse_acmt007(base_msg)
-
-        if "acmt.015" in ns_str:
-            return self._parse_acmt015(base_msg)
-
-        if "camt.086" in ns_str:
-            return self._parse_camt086(base_msg)
+        for match in _DIALECT_PATTERN.finditer(ns_str):
+            detailed_parser = _DETAILED_PARSERS.get(match.group())
+            if detailed_parser is not None:
+                return detailed_parser(self, base_msg, ns_str)
 
         return base_msg
 
@@ -1292,3 +1329,27 @@ class OpenPurseParser:
         Kept for backward-compatibility.
         """
         return self.parse().to_dict()
+
+
+# Dialect -> detailed builder for parse_detailed(); one dict lookup instead of an if/elif chain
+_DETAILED_PARSERS: Dict[str, Callable[[OpenPurseParser, PaymentMessage, str], PaymentMessage]] = {
+    "camt.054": lambda parser, base, ns: parser._parse_camt054_detailed(base),
+    "pacs.008": lambda parser, base, ns: parser._parse_pacs008_detailed(base),
+    "camt.004": lambda parser, base, ns: parser._parse_camt004_detailed(base),
+    "camt.052": lambda parser, base, ns: parser._parse_camt05X_detailed(base, ns),
+    "camt.053": lambda parser, base, ns: parser._parse_camt05X_detailed(base, ns),
+    "pain.001": lambda parser, base, ns: parser._parse_pain00X_detailed(base, ns),
+    "pain.008": lambda parser, base, ns: parser._parse_pain00X_detailed(base, ns),
+    "pain.002": lambda parser, base, ns: parser._parse_pain002_detailed(base),
+    "camt.056": lambda parser, base, ns: parser._parse_camt056(),
+    "camt.029": lambda parser, base, ns: parser._parse_camt029(),
+    "fxtr.014": lambda parser, base, ns: parser._parse_fxtr014(base),
+    "sese.023": lambda parser, base, ns: parser._parse_sese023(base),
+    "pacs.004": lambda parser, base, ns: parser._parse_pacs004(base),
+    "pacs.009": lambda parser, base, ns: parser._parse_pacs009(base),
+    "setr.004": lambda parser, base, ns: parser._parse_setr004(base),
+    "setr.010": lambda parser, base, ns: parser._parse_setr010(base),
+    "acmt.007": lambda parser, base, ns: parser._parse_acmt007(base),
+    "acmt.015": lambda parser, base, ns: parser._parse_acmt015(base),
+    "camt.086": lambda parser, base, ns: parser._parse_camt086(base),
+}
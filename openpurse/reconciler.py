@@ -1,4 +1,5 @@
-from typing import List
+from collections import defaultdict, deque
+from typing import Dict, List, Set
 
 from openpurse.models import Camt029Message, Camt056Message, Pain002Message, PaymentMessage
 
@@ -91,23 +92,81 @@ class Reconciler:
                 matches.append(candidate)
         return matches
 
+    @staticmethod
+    def _build_index(all_messages: List[PaymentMessage]) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Buckets message positions by every identifier ``is_match`` can link on.
+
+        Each bucket maps an identifier value to the positions of the messages carrying it,
+        so the candidates for a message are a handful of dict lookups instead of a scan.
+        """
+        index: Dict[str, Dict[str, List[int]]] = {
+            "uetr": defaultdict(list),
+            "end_to_end_id": defaultdict(list),
+            "message_id": defaultdict(list),
+            "original_message_id": defaultdict(list),
+            "case_id": defaultdict(list),
+        }
+        for pos, msg in enumerate(all_messages):
+            if msg.uetr:
+                index["uetr"][msg.uetr].append(pos)
+            if msg.end_to_end_id:
+                index["end_to_end_id"][msg.end_to_end_id].append(pos)
+            if msg.message_id:
+                index["message_id"][msg.message_id].append(pos)
+            if isinstance(msg, (Pain002Message, Camt056Message)) and msg.original_message_id:
+                index["original_message_id"][msg.original_message_id].append(pos)
+            if isinstance(msg, (Camt029Message, Camt056Message)) and msg.case_id is not None:
+                index["case_id"][msg.case_id].append(pos)
+        return index
+
+    @staticmethod
+    def _candidate_positions(
+        msg: PaymentMessage, index: Dict[str, Dict[str, List[int]]]
+    ) -> List[int]:
+        """
+        Returns, in pool order, the positions of every message that could match ``msg``.
+
+        This is a superset of the real matches: ``is_match`` still has the final say,
+        including the amount verification step.
+        """
+        positions: Set[int] = set()
+        if msg.uetr:
+            positions.update(index["uetr"].get(msg.uetr, ()))
+        if msg.end_to_end_id:
+            positions.update(index["end_to_end_id"].get(msg.end_to_end_id, ()))
+        if isinstance(msg, (Pain002Message, Camt056Message)) and msg.original_message_id:
+            positions.update(index["message_id"].get(msg.original_message_id, ()))
+        if msg.message_id:
+            positions.update(index["original_message_id"].get(msg.message_id, ()))
+        if isinstance(msg, (Camt029Message, Camt056Message)) and msg.case_id is not None:
+            positions.update(index["case_id"].get(msg.case_id, ()))
+        return sorted(positions)
+
     @staticmethod
     def trace_lifecycle(
         seed: PaymentMessage, all_messages: List[PaymentMessage]
     ) -> List[PaymentMessage]:
         """
         Recursively builds a chronological chain of related messages starting from a seed.
+
+        The pool is indexed by UETR, EndToEndId, message references and case id up front,
+        so each step of the walk only compares against messages sharing an identifier
+        rather than rescanning the whole pool.
         """
+        index = Reconciler._build_index(all_messages)
         timeline = [seed]
         seen_ids = {id(seed)}
 
-        queue = [seed]
+        queue = deque([seed])
         while queue:
-            current = queue.pop(0)
-            matches = Reconciler.find_matches(current, all_messages)
+            current = queue.popleft()
 
-            for match in matches:
-                if id(match) not in seen_ids:
+            for pos in Reconciler._candidate_positions(current, index):
+                match = all_messages[pos]
+                if id(match) in seen_ids or match == current:
+                    continue
+                if Reconciler.is_match(current, match):
                     seen_ids.add(id(match))
                     timeline.append(match)
                     queue.append(match)
@@ -1,9 +1,105 @@
-import uuid
+import os
+import time
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from lxml import etree
 
 from openpurse.models import PaymentMessage
 
+# Last wall-clock second seen by the MT translator and its formatted YYMMDD string.
+# Batch translations hit the same second repeatedly, so the strftime only runs on a tick.
+_DATE_CACHE: Tuple[int, str] = (-1, "")
+
+_MT_BIC_DEFAULT = "XXXXXXXXXXXX"
+
+
+def _pad_mt_bic(bic: Optional[str]) -> str:
+    """
+    Pads or truncates a BIC to the 12-character logical terminal form used in MT headers.
+    """
+    if not bic:
+        return _MT_BIC_DEFAULT
+    n = len(bic)
+    if n == 12:
+        return bic
+    if n == 11:
+        return bic + "X"
+    if n > 12:
+        return bic[:12]
+    return bic + "X" * (12 - n)
+
+
+def _fmt_mt_amount(value: Any) -> str:
+    """
+    Formats an amount using the SWIFT MT decimal comma, defaulting missing values to '0,00'.
+    """
+    if not value:
+        return "0,00"
+    if not isinstance(value, str):
+        value = str(value)
+    if "." in value:
+        return value.replace(".", ",")
+    return value + ","
+
+
+def _today_yymmdd() -> str:
+    """
+    Returns the current local date formatted as SWIFT MT YYMMDD, cached per second.
+    """
+    global _DATE_CACHE
+    now = int(time.time())
+    cached_at, date_str = _DATE_CACHE
+    if now != cached_at:
+        date_str = datetime.fromtimestamp(now).strftime("%y%m%d")
+        _DATE_CACHE = (now, date_str)
+    return date_str
+
+
+def _new_uetr() -> str:
+    """
+    Generates a random RFC 4122 UUIDv4 string for use as a default UETR.
+
+    Formats the 16 random bytes directly instead of going through ``uuid.UUID``.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+@lru_cache(maxsize=1024)
+def _postal_address_fields(
+    country: Optional[str],
+    town_name: Optional[str],
+    post_code: Optional[str],
+    street_name: Optional[str],
+    building_number: Optional[str],
+    address_lines: Tuple[str, ...],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolves a postal address to the ordered (tag, text) pairs emitted under <PstlAdr>.
+
+    Batches tend to repeat the same debtor/creditor addresses, so the branching is cached
+    on the extracted field values rather than redone for every message.
+    """
+    fields = []
+    if country:
+        fields.append(("Ctry", country))
+    if town_name:
+        fields.append(("TwnNm", town_name))
+    if post_code:
+        fields.append(("PstCd", post_code))
+    if street_name:
+        fields.append(("StrtNm", street_name))
+    if building_number:
+        fields.append(("BldgNb", building_number))
+    for line in address_lines:
+        fields.append(("AdrLine", line))
+    return tuple(fields)
+
 
 class Translator:
     """
@@ -21,18 +117,10 @@ class Translator:
             raise NotImplementedError(f"Translation to MT{mt_type} is not yet supported.")
 
         # Basic defaults
-        sender = (message.sender_bic or "XXXXXXXXXXXX").ljust(12, "X")[:12]
-        receiver = (message.receiver_bic or "XXXXXXXXXXXX").ljust(12, "X")[:12]
+        sender = _pad_mt_bic(message.sender_bic)
+        receiver = _pad_mt_bic(message.receiver_bic)
 
-        # Block 1: {1:F01[Sender 12][Session 4][Seq 6]}
-        block_1 = f"{{1:F01{sender}0000000000}}"
-
-        # Block 2: {2:I[Type][Receiver 12]N}
-        block_2 = f"{{2:I{mt_type}{receiver}N}}"
-
-        # Block 3: {3:{121:[UUIDv4 UETR]}}
-        msg_uetr = message.uetr or str(uuid.uuid4())
-        block_3 = f"{{3:{{121:{msg_uetr}}}}}"
+        msg_uetr = message.uetr or _new_uetr()
 
         # Block 4: Body
         msg_id, curr, amt_str, date_str = Translator._get_mt_common_fields(message)
@@ -68,21 +156,26 @@ class Translator:
                 message, msg_id, curr, amt_str, date_str, sender
             )
 
-        return f"{block_1}{block_2}{block_3}{block_4}".encode("utf-8")
+        # Every Block 4 builder produces its body in one exactly-sized string build (a single
+        # f-string, or a join for repeating sequences); the frame is added and encoded once here.
+        # Blocks 1-3 are emitted in the same string build as Block 4:
+        # Block 1: {1:F01[Sender 12][Session 4][Seq 6]}
+        # Block 2: {2:I[Type][Receiver 12]N}
+        # Block 3: {3:{121:[UUIDv4 UETR]}}
+        return (
+            f"{{1:F01{sender}0000000000}}"
+            f"{{2:I{mt_type}{receiver}N}}"
+            f"{{3:{{121:{msg_uetr}}}}}"
+            f"{block_4}"
+        ).encode("utf-8")
 
     @staticmethod
     def _get_mt_common_fields(message: PaymentMessage) -> tuple[str, str, str, str]:
         msg_id = message.message_id or "NONREF"
         curr = message.currency or "USD"
 
-        # Clean amount string to use comma for decimals (as per SWIFT MT standard)
-        amt_str = message.amount or "0.00"
-        if "." in amt_str:
-            amt_str = amt_str.replace(".", ",")
-        else:
-            amt_str += ","
-
-        date_str = datetime.now().strftime("%y%m%d")
+        amt_str = _fmt_mt_amount(message.amount)
+        date_str = _today_yymmdd()
         return msg_id, curr, amt_str, date_str
 
     @staticmethod
@@ -99,41 +192,37 @@ class Translator:
         if not initiating_party:
             initiating_party = "N/A"
 
-        block4 = (
+        parts = [
             f"{{4:\n"
             f":20:{msg_id}\n"
             f":50H:/{sender}\n"
             f"{initiating_party}\n"
             f":30:{date_str}\n"
-        )
+        ]
 
         transactions = getattr(message, "payment_information", [])
         if not transactions:
             end_to_end = message.end_to_end_id or "NONREF"
             creditor = message.creditor_name or "N/A"
-            block4 += (
+            parts.append(
                 f":21:{end_to_end}\n" f":32B:{curr}{amt_str}\n" f":59:/{receiver}\n" f"{creditor}\n"
             )
         else:
             for tx in transactions:
                 end_to_end = tx.get("end_to_end_id") or "NONREF"
-                tx_amt = tx.get("amount") or "0.00"
-                if "." in tx_amt:
-                    tx_amt = tx_amt.replace(".", ",")
-                else:
-                    tx_amt += ","
+                tx_amt = _fmt_mt_amount(tx.get("amount"))
                 tx_curr = tx.get("currency") or curr
                 creditor = tx.get("creditor_name") or "N/A"
 
-                block4 += (
+                parts.append(
                     f":21:{end_to_end}\n"
                     f":32B:{tx_curr}{tx_amt}\n"
                     f":59:/{receiver}\n"
                     f"{creditor}\n"
                 )
 
-        block4 += "-}"
-        return block4
+        parts.append("-}")
+        return "".join(parts)
 
     @staticmethod
     def _build_mt103_block4(
@@ -202,23 +291,24 @@ class Translator:
     def _build_mt940_block4(
         message: PaymentMessage, msg_id: str, curr: str, amt_str: str, date_str: str, sender: str
     ) -> str:
-        statements_loop = ""
+        statement_lines = []
         open_bal = f":60F:C{date_str}{curr}{amt_str}"
         close_bal = f":62F:C{date_str}{curr}{amt_str}"
 
-        if hasattr(message, "entries") and isinstance(message.entries, list):
-            for entry in message.entries:
-                e_amt = str(entry.get("amount", "0.00")).replace(".", ",")
+        entries = getattr(message, "entries", None)
+        if entries:
+            for entry in entries:
+                e_amt = _fmt_mt_amount(entry.get("amount"))
                 e_cd = "C" if entry.get("credit_debit_indicator") == "CRDT" else "D"
                 e_ref = entry.get("reference", "NONREF")
 
                 # Construct an MT940 :61: statement line
                 # Format: ValueDate[6]EntryDate[4]CR/DR[1]Amount[15]...
-                statements_loop += f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n"
+                statement_lines.append(f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n")
 
                 e_remit = entry.get("remittance")
                 if e_remit:
-                    statements_loop += f":86:{e_remit}\n"
+                    statement_lines.append(f":86:{e_remit}\n")
 
         return (
             f"{{4:\n"
@@ -226,7 +316,7 @@ class Translator:
             f":25:/{sender}\n"
             f":28C:1/1\n"
             f"{open_bal}\n"
-            f"{statements_loop}"
+            f"{''.join(statement_lines)}"
             f"{close_bal}\n"
             f"-}}"
         )
@@ -235,27 +325,28 @@ class Translator:
     def _build_mt942_block4(
         message: PaymentMessage, msg_id: str, curr: str, amt_str: str, date_str: str, sender: str
     ) -> str:
-        statements_loop = ""
+        statement_lines = []
         interim_bal = f":34F:C{curr}{amt_str}"
 
-        if hasattr(message, "entries") and isinstance(message.entries, list):
-            for entry in message.entries:
-                e_amt = str(entry.get("amount", "0.00")).replace(".", ",")
+        entries = getattr(message, "entries", None)
+        if entries:
+            for entry in entries:
+                e_amt = _fmt_mt_amount(entry.get("amount"))
                 e_cd = "C" if entry.get("credit_debit_indicator") == "CRDT" else "D"
                 e_ref = entry.get("reference", "NONREF")
 
-                statements_loop += f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n"
+                statement_lines.append(f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n")
 
                 e_remit = entry.get("remittance")
                 if e_remit:
-                    statements_loop += f":86:{e_remit}\n"
+                    statement_lines.append(f":86:{e_remit}\n")
 
         return (
             f"{{4:\n"
             f":20:{msg_id}\n"
             f":25:/{sender}\n"
             f"{interim_bal}\n"
-            f"{statements_loop}"
+            f"{''.join(statement_lines)}"
             f"-}}"
         )
 
@@ -263,24 +354,25 @@ class Translator:
     def _build_mt950_block4(
         message: PaymentMessage, msg_id: str, curr: str, amt_str: str, date_str: str, sender: str
     ) -> str:
-        statements_loop = ""
+        statement_lines = []
         open_bal = f":60F:C{date_str}{curr}{amt_str}"
         close_bal = f":62F:C{date_str}{curr}{amt_str}"
 
-        if hasattr(message, "entries") and isinstance(message.entries, list):
-            for entry in message.entries:
-                e_amt = str(entry.get("amount", "0.00")).replace(".", ",")
+        entries = getattr(message, "entries", None)
+        if entries:
+            for entry in entries:
+                e_amt = _fmt_mt_amount(entry.get("amount"))
                 e_cd = "C" if entry.get("credit_debit_indicator") == "CRDT" else "D"
                 e_ref = entry.get("reference", "NONREF")
 
-                statements_loop += f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n"
+                statement_lines.append(f":61:{date_str}{date_str[2:]}{e_cd}{e_amt}NTRF{e_ref}\n")
 
         return (
             f"{{4:\n"
             f":20:{msg_id}\n"
             f":25:/{sender}\n"
             f"{open_bal}\n"
-            f"{statements_loop}"
+            f"{''.join(statement_lines)}"
             f"{close_bal}\n"
             f"-}}"
         )
@@ -299,13 +391,8 @@ class Translator:
             Translator._get_mx_common_fields(message)
         )
 
-        dbtr_addr_xml = Translator._build_addr_xml(getattr(message, "debtor_address", None))
-        cdtr_addr_xml = Translator._build_addr_xml(getattr(message, "creditor_address", None))
-
-        xml_template = ""
-
         if mx_type == "pacs.008":
-            xml_template = Translator._build_mx_pacs008(
+            document = Translator._build_mx_pacs008(
                 msg_id,
                 sender,
                 receiver,
@@ -314,20 +401,23 @@ class Translator:
                 curr,
                 amt,
                 debtor,
-                dbtr_addr_xml,
+                getattr(message, "debtor_address", None),
                 creditor,
-                cdtr_addr_xml,
+                getattr(message, "creditor_address", None),
             )
         elif mx_type == "pacs.009":
-            xml_template = Translator._build_mx_pacs009(
+            document = Translator._build_mx_pacs009(
                 msg_id, sender, receiver, e2e, uetr, curr, amt
             )
         elif mx_type == "camt.054":
-            xml_template = Translator._build_mx_camt054(msg_id, receiver, curr, amt, e2e)
+            document = Translator._build_mx_camt054(msg_id, receiver, curr, amt, e2e)
         elif mx_type == "camt.053":
-            xml_template = Translator._build_mx_camt053(message, msg_id, receiver, curr, amt)
+            document = Translator._build_mx_camt053(message, msg_id, receiver, curr, amt)
+        else:
+            return b""
 
-        return xml_template.encode("utf-8")
+        # libxml2 handles escaping and serialisation of the whole tree in C
+        return etree.tostring(document, pretty_print=True, xml_declaration=True, encoding="UTF-8")
 
     @staticmethod
     def _get_mx_common_fields(message: PaymentMessage) -> tuple[str, str, str, str, str, str, str, str, str]:
@@ -336,7 +426,7 @@ class Translator:
 
         # UETR is strongly associated with the E2E block in XML
         # (often right beside it, e.g. <UETR> UUID </UETR>)
-        uetr = message.uetr or str(uuid.uuid4())
+        uetr = message.uetr or _new_uetr()
 
         amt = message.amount or "0.00"
         curr = message.currency or "USD"
@@ -347,26 +437,87 @@ class Translator:
         return msg_id, e2e, uetr, amt, curr, sender, receiver, debtor, creditor
 
     @staticmethod
-    def _build_addr_xml(addr: Any) -> str:
+    def _new_document(schema: str) -> Tuple[etree._Element, str]:
+        """
+        Creates an empty ISO 20022 Document root and returns it with its Clark-notation prefix.
+        """
+        namespace = f"urn:iso:std:iso:20022:tech:xsd:{schema}"
+        q = f"{{{namespace}}}"
+        return etree.Element(q + "Document", nsmap={None: namespace}), q
+
+    @staticmethod
+    def _add_text(parent: etree._Element, tag: str, text: Any) -> etree._Element:
+        """
+        Appends a child element carrying the given text. Non-string values such as
+        Decimal amounts or integer ids are converted with str(), as the old templates did.
+        """
+        el = etree.SubElement(parent, tag)
+        el.text = text if isinstance(text, str) else str(text)
+        return el
+
+    @staticmethod
+    def _add_bicfi(parent: etree._Element, q: str, tag: str, bic: str) -> None:
+        """
+        Appends a <tag><FinInstnId><BICFI>bic</BICFI></FinInstnId></tag> agent block.
+        """
+        fin_instn_id = etree.SubElement(etree.SubElement(parent, q + tag), q + "FinInstnId")
+        Translator._add_text(fin_instn_id, q + "BICFI", bic)
+
+    @staticmethod
+    def _add_other_id(parent: etree._Element, q: str, value: str) -> None:
+        """
+        Appends an <Id><Othr><Id>value</Id></Othr></Id> identification block.
+        """
+        othr = etree.SubElement(etree.SubElement(parent, q + "Id"), q + "Othr")
+        Translator._add_text(othr, q + "Id", value)
+
+    @staticmethod
+    def _build_addr_xml(parent: etree._Element, q: str, addr: Any) -> None:
         if not addr:
-            return ""
-        inner = ""
-        if getattr(addr, "country", None):
-            inner += f"<Ctry>{addr.country}</Ctry>"
-        if getattr(addr, "town_name", None):
-            inner += f"<TwnNm>{addr.town_name}</TwnNm>"
-        if getattr(addr, "post_code", None):
-            inner += f"<PstCd>{addr.post_code}</PstCd>"
-        if getattr(addr, "street_name", None):
-            inner += f"<StrtNm>{addr.street_name}</StrtNm>"
-        if getattr(addr, "building_number", None):
-            inner += f"<BldgNb>{addr.building_number}</BldgNb>"
-        lines = getattr(addr, "address_lines", None)
-        if lines:
-            for line in lines:
-                inner += f"<AdrLine>{line}</AdrLine>"
-
-        return f"<PstlAdr>{inner}</PstlAdr>" if inner else ""
+            return
+        fields = _postal_address_fields(
+            getattr(addr, "country", None),
+            getattr(addr, "town_name", None),
+            getattr(addr, "post_code", None),
+            getattr(addr, "street_name", None),
+            getattr(addr, "building_number", None),
+            tuple(getattr(addr, "address_lines", None) or ()),
+        )
+        if fields:
+            pstl_adr = etree.SubElement(parent, q + "PstlAdr")
+            for tag, text in fields:
+                Translator._add_text(pstl_adr, q + tag, text)
+
+    @staticmethod
+    def _build_mx_credit_transfer(
+        schema: str,
+        root_tag: str,
+        msg_id: str,
+        sender: str,
+        receiver: str,
+        e2e: str,
+        uetr: str,
+        curr: str,
+        amt: str,
+    ) -> Tuple[etree._Element, etree._Element, str]:
+        """
+        Builds the GrpHdr and PmtId/amount part shared by pacs.008 and pacs.009.
+        Returns the document, the CdtTrfTxInf element and the namespace prefix.
+        """
+        document, q = Translator._new_document(schema)
+        root = etree.SubElement(document, q + root_tag)
+
+        grp_hdr = etree.SubElement(root, q + "GrpHdr")
+        Translator._add_text(grp_hdr, q + "MsgId", msg_id)
+        Translator._add_bicfi(grp_hdr, q, "InstgAgt", sender)
+        Translator._add_bicfi(grp_hdr, q, "InstdAgt", receiver)
+
+        tx_inf = etree.SubElement(root, q + "CdtTrfTxInf")
+        pmt_id = etree.SubElement(tx_inf, q + "PmtId")
+        Translator._add_text(pmt_id, q + "EndToEndId", e2e)
+        Translator._add_text(pmt_id, q + "UETR", uetr)
+        Translator._add_text(tx_inf, q + "IntrBkSttlmAmt", amt).set("Ccy", curr)
+        return document, tx_inf, q
 
     @staticmethod
     def _build_mx_pacs008(
@@ -378,112 +529,86 @@ class Translator:
         curr: str,
         amt: str,
         debtor: str,
-        dbtr_addr_xml: str,
+        debtor_address: Any,
         creditor: str,
-        cdtr_addr_xml: str,
-    ) -> str:
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08">
-    <FIToFICstmrCdtTrf>
-        <GrpHdr>
-            <MsgId>{msg_id}</MsgId>
-            <InstgAgt><FinInstnId><BICFI>{sender}</BICFI></FinInstnId></InstgAgt>
-            <InstdAgt><FinInstnId><BICFI>{receiver}</BICFI></FinInstnId></InstdAgt>
-        </GrpHdr>
-        <CdtTrfTxInf>
-            <PmtId>
-                <EndToEndId>{e2e}</EndToEndId>
-                <UETR>{uetr}</UETR>
-            </PmtId>
-            <IntrBkSttlmAmt Ccy="{curr}">{amt}</IntrBkSttlmAmt>
-            <Dbtr><Nm>{debtor}</Nm>{dbtr_addr_xml}</Dbtr>
-            <Cdtr><Nm>{creditor}</Nm>{cdtr_addr_xml}</Cdtr>
-        </CdtTrfTxInf>
-    </FIToFICstmrCdtTrf>
-</Document>"""
+        creditor_address: Any,
+    ) -> etree._Element:
+        document, tx_inf, q = Translator._build_mx_credit_transfer(
+            "pacs.008.001.08", "FIToFICstmrCdtTrf", msg_id, sender, receiver, e2e, uetr, curr, amt
+        )
+
+        dbtr = etree.SubElement(tx_inf, q + "Dbtr")
+        Translator._add_text(dbtr, q + "Nm", debtor)
+        Translator._build_addr_xml(dbtr, q, debtor_address)
+
+        cdtr = etree.SubElement(tx_inf, q + "Cdtr")
+        Translator._add_text(cdtr, q + "Nm", creditor)
+        Translator._build_addr_xml(cdtr, q, creditor_address)
+        return document
 
     @staticmethod
-    def _build_mx_pacs009(msg_id: str, sender: str, receiver: str, e2e: str, uetr: str, curr: str, amt: str) -> str:
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.009.001.08">
-    <FICdtTrf>
-        <GrpHdr>
-            <MsgId>{msg_id}</MsgId>
-            <InstgAgt><FinInstnId><BICFI>{sender}</BICFI></FinInstnId></InstgAgt>
-            <InstdAgt><FinInstnId><BICFI>{receiver}</BICFI></FinInstnId></InstdAgt>
-        </GrpHdr>
-        <CdtTrfTxInf>
-            <PmtId>
-                <EndToEndId>{e2e}</EndToEndId>
-                <UETR>{uetr}</UETR>
-            </PmtId>
-            <IntrBkSttlmAmt Ccy="{curr}">{amt}</IntrBkSttlmAmt>
-            <Dbtr><FinInstnId><BICFI>{sender}</BICFI></FinInstnId></Dbtr>
-            <Cdtr><FinInstnId><BICFI>{receiver}</BICFI></FinInstnId></Cdtr>
-        </CdtTrfTxInf>
-    </FICdtTrf>
-</Document>"""
+    def _build_mx_pacs009(
+        msg_id: str, sender: str, receiver: str, e2e: str, uetr: str, curr: str, amt: str
+    ) -> etree._Element:
+        document, tx_inf, q = Translator._build_mx_credit_transfer(
+            "pacs.009.001.08", "FICdtTrf", msg_id, sender, receiver, e2e, uetr, curr, amt
+        )
+        Translator._add_bicfi(tx_inf, q, "Dbtr", sender)
+        Translator._add_bicfi(tx_inf, q, "Cdtr", receiver)
+        return document
 
     @staticmethod
-    def _build_mx_camt054(msg_id: str, receiver: str, curr: str, amt: str, e2e: str) -> str:
-        c_d_ind = "CRDT" if float(amt) > 0 else "DBIT"
-        abs_amt = str(abs(float(amt)))
-
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.054.001.08">
-    <BkToCstmrDbtCdtNtfctn>
-        <GrpHdr>
-            <MsgId>{msg_id}</MsgId>
-        </GrpHdr>
-        <Ntfctn>
-            <Id>{msg_id}-NTF</Id>
-            <Acct>
-                <Id><Othr><Id>{receiver}</Id></Othr></Id>
-            </Acct>
-            <Ntry>
-                <Amt Ccy="{curr}">{abs_amt}</Amt>
-                <CdtDbtInd>{c_d_ind}</CdtDbtInd>
-                <Sts>BOOK</Sts>
-                <NtryDtls>
-                    <TxDtls>
-                        <Refs><EndToEndId>{e2e}</EndToEndId></Refs>
-                    </TxDtls>
-                </NtryDtls>
-            </Ntry>
-        </Ntfctn>
-    </BkToCstmrDbtCdtNtfctn>
-</Document>"""
+    def _build_mx_camt054(
+        msg_id: str, receiver: str, curr: str, amt: Any, e2e: str
+    ) -> etree._Element:
+        # Decide the direction from the sign character so the amount never passes through float
+        amt = str(amt).strip()
+        is_debit = amt.startswith("-")
+        abs_amt = amt[1:] if is_debit or amt.startswith("+") else amt
+        # Only amounts above zero are credits, so a zero amount stays DBIT as it always has
+        is_zero = not abs_amt.strip("0.")
+        c_d_ind = "DBIT" if is_debit or is_zero else "CRDT"
+
+        document, q = Translator._new_document("camt.054.001.08")
+        root = etree.SubElement(document, q + "BkToCstmrDbtCdtNtfctn")
+        Translator._add_text(etree.SubElement(root, q + "GrpHdr"), q + "MsgId", msg_id)
+
+        ntfctn = etree.SubElement(root, q + "Ntfctn")
+        Translator._add_text(ntfctn, q + "Id", f"{msg_id}-NTF")
+        Translator._add_other_id(etree.SubElement(ntfctn, q + "Acct"), q, receiver)
+
+        ntry = etree.SubElement(ntfctn, q + "Ntry")
+        Translator._add_text(ntry, q + "Amt", abs_amt).set("Ccy", curr)
+        Translator._add_text(ntry, q + "CdtDbtInd", c_d_ind)
+        Translator._add_text(ntry, q + "Sts", "BOOK")
+        tx_dtls = etree.SubElement(etree.SubElement(ntry, q + "NtryDtls"), q + "TxDtls")
+        Translator._add_text(etree.SubElement(tx_dtls, q + "Refs"), q + "EndToEndId", e2e)
+        return document
 
     @staticmethod
-    def _build_mx_camt053(message: PaymentMessage, msg_id: str, receiver: str, curr: str, amt: str) -> str:
-        entries_xml = ""
-        if hasattr(message, "entries") and isinstance(message.entries, list):
-            for entry in message.entries:
-                e_amt = str(entry.get("amount", "0.00"))
-                e_cd = entry.get("credit_debit_indicator", "CRDT")
-                e_ref = entry.get("reference", "NONREF")
-                entries_xml += f"""
-            <Ntry>
-                <NtryRef>{e_ref}</NtryRef>
-                <Amt Ccy="{curr}">{e_amt}</Amt>
-                <CdtDbtInd>{e_cd}</CdtDbtInd>
-                <Sts>BOOK</Sts>
-                <BkTxCd><Prtry><Cd>NTRF</Cd></Prtry></BkTxCd>
-            </Ntry>"""
-
-        xml_template = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.08">
-    <BkToCstmrStmt>
-        <GrpHdr>
-            <MsgId>{msg_id}</MsgId>
-        </GrpHdr>
-        <Stmt>
-            <Id>{msg_id}-STMT</Id>
-            <Acct>
-                <Id><Othr><Id>{receiver}</Id></Othr></Id>
-            </Acct>{entries_xml}
-        </Stmt>
-    </BkToCstmrStmt>
-</Document>"""
-
-        return xml_template
+    def _build_mx_camt053(
+        message: PaymentMessage, msg_id: str, receiver: str, curr: str, amt: str
+    ) -> etree._Element:
+        document, q = Translator._new_document("camt.053.001.08")
+        root = etree.SubElement(document, q + "BkToCstmrStmt")
+        Translator._add_text(etree.SubElement(root, q + "GrpHdr"), q + "MsgId", msg_id)
+
+        stmt = etree.SubElement(root, q + "Stmt")
+        Translator._add_text(stmt, q + "Id", f"{msg_id}-STMT")
+        Translator._add_other_id(etree.SubElement(stmt, q + "Acct"), q, receiver)
+
+        entries = getattr(message, "entries", None)
+        if entries:
+            for entry in entries:
+                ntry = etree.SubElement(stmt, q + "Ntry")
+                Translator._add_text(ntry, q + "NtryRef", str(entry.get("reference", "NONREF")))
+                Translator._add_text(ntry, q + "Amt", str(entry.get("amount", "0.00"))).set(
+                    "Ccy", curr
+                )
+                Translator._add_text(
+                    ntry, q + "CdtDbtInd", str(entry.get("credit_debit_indicator", "CRDT"))
+                )
+                Translator._add_text(ntry, q + "Sts", "BOOK")
+                prtry = etree.SubElement(etree.SubElement(ntry, q + "BkTxCd"), q + "Prtry")
+                Translator._add_text(prtry, q + "Cd", "NTRF")
+        return document
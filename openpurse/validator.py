@@ -1,8 +1,61 @@
+import codecs
 import re
-from typing import Optional
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from openpurse.models import PaymentMessage, ValidationReport
 
+# BBAN structures from the SWIFT IBAN registry (ISO 13616), in registry notation:
+# "<len>!n" digits, "<len>!a" uppercase letters, "<len>!c" alphanumerics.
+_IBAN_BBAN_FORMATS: Dict[str, str] = {
+    "AD": "4!n4!n12!c", "AE": "3!n16!n", "AL": "8!n16!c", "AT": "5!n11!n", "AZ": "4!a20!c",
+    "BA": "3!n3!n8!n2!n", "BE": "3!n7!n2!n", "BG": "4!a4!n2!n8!c", "BH": "4!a14!c",
+    "BR": "8!n5!n10!n1!a1!c", "BY": "4!c4!n16!c", "CH": "5!n12!c", "CR": "4!n14!n",
+    "CY": "3!n5!n16!c", "CZ": "4!n6!n10!n", "DE": "8!n10!n", "DK": "4!n9!n1!n", "DO": "4!c20!n",
+    "EE": "2!n2!n11!n1!n", "EG": "4!n4!n17!n", "ES": "4!n4!n1!n1!n10!n", "FI": "3!n11!n",
+    "FO": "4!n9!n1!n", "FR": "5!n5!n11!c2!n", "GB": "4!a6!n8!n", "GE": "2!a16!n",
+    "GI": "4!a15!c", "GL": "4!n9!n1!n", "GR": "3!n4!n16!c", "GT": "4!c20!c", "HR": "7!n10!n",
+    "HU": "3!n4!n1!n15!n1!n", "IE": "4!a6!n8!n", "IL": "3!n3!n13!n", "IQ": "4!a3!n12!n",
+    "IS": "4!n2!n6!n10!n", "IT": "1!a5!n5!n12!c", "JO": "4!a4!n18!c", "KW": "4!a22!c",
+    "KZ": "3!n13!c", "LB": "4!n20!c", "LC": "4!a24!c", "LI": "5!n12!c", "LT": "5!n11!n",
+    "LU": "3!n13!c", "LV": "4!a13!c", "MC": "5!n5!n11!c2!n", "MD": "2!c18!c",
+    "ME": "3!n13!n2!n", "MK": "3!n10!c2!n", "MR": "5!n5!n11!n2!n", "MT": "4!a5!n18!c",
+    "MU": "4!a2!n2!n12!n3!n3!a", "NL": "4!a10!n", "NO": "4!n6!n1!n", "PK": "4!a16!c",
+    "PL": "8!n16!n", "PS": "4!a21!c", "PT": "4!n4!n11!n2!n", "QA": "4!a21!c", "RO": "4!a16!c",
+    "RS": "3!n13!n2!n", "SA": "2!n18!c", "SC": "4!a2!n2!n16!n3!a", "SE": "3!n16!n1!n",
+    "SI": "5!n8!n2!n", "SK": "4!n6!n10!n", "SM": "1!a5!n5!n12!c", "ST": "4!n4!n11!n2!n",
+    "SV": "4!a20!n", "TL": "3!n14!n2!n", "TN": "2!n3!n13!n2!n", "TR": "5!n1!n16!c",
+    "UA": "6!n19!c", "VA": "3!n15!n", "VG": "4!a16!n", "XK": "4!n10!n2!n",
+}
+
+
+def _compile_bban_format(bban_format: str) -> Tuple[int, Tuple[Tuple[int, int, str], ...]]:
+    """
+    Turns a registry BBAN format into the full IBAN length and the (start, end, kind)
+    slices that need a character-class check. Alphanumeric runs are dropped because the
+    generic ISO 13616 scan already guarantees them, and adjacent runs of the same class
+    are merged so each country needs only a few slice checks.
+    """
+    segments: List[List[Any]] = []
+    offset = 4
+    for run_length, kind in re.findall(r"(\d+)!([nac])", bban_format):
+        end = offset + int(run_length)
+        if kind != "c":
+            if segments and segments[-1][2] == kind and segments[-1][1] == offset:
+                segments[-1][1] = end
+            else:
+                segments.append([offset, end, kind])
+        offset = end
+    return offset, tuple((start, end, kind) for start, end, kind in segments)
+
+
+_IBAN_STRUCTURES = {cc: _compile_bban_format(fmt) for cc, fmt in _IBAN_BBAN_FORMATS.items()}
+
+# Byte-order marks that rule out sniffing a payload's first byte as ASCII
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
 
 class Validator:
     """
@@ -10,12 +63,31 @@ class Validator:
     SWIFT & ISO compliance patterns.
     """
 
-    _bic_pattern = re.compile(r"\A[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?\Z")
-    _iban_clean_pattern = re.compile(r"[^A-Z0-9]")
-    _iban_format_pattern = re.compile(r"\A[A-Z]{2}[0-9]{2}[A-Z0-9]{11,30}\Z")
-    _uuid4_pattern = re.compile(
-        r"\A[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z", re.I
+    _known_bics: FrozenSet[str] = frozenset()
+    _bic_error = (
+        "Invalid BIC format: '{}'. Must securely match ISO 9362 standard 8 or 11 characters."
     )
+    # Byte deletion set for everything outside ASCII A-Z/0-9, applied with bytes.translate
+    _iban_non_alnum_bytes = bytes(c for c in range(256) if not (48 <= c <= 57 or 65 <= c <= 90))
+    _iban_separator_table = str.maketrans("", "", " -.")
+    # Character -> (value, decimal scale) for the Mod-97 scan: digits shift the remainder by
+    # one decimal place, letters (A=10 ... Z=35) by two, separators (scale 0) are skipped
+    _iban_char_values: Dict[str, Tuple[int, int]] = {
+        **{c: (ord(c) - 48, 10) for c in "0123456789"},
+        **{c: (ord(c) - 55, 100) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+        **{c: (0, 0) for c in " -."},
+    }
+    # Block 1 {1:F01[BIC12][Session+Seq 10]} and Block 2 {2:I103[BIC12]XXXXN...} in one
+    # alternation, so both headers are located in a single scan of the message
+    _mt_header_pattern = re.compile(
+        r"\{1:[A-Z0-9]{3}(?P<b1_bic>[A-Z0-9]{12})[0-9]{10}\}"
+        r"|\{2:[IO][0-9]{3}(?P<b2_bic>[A-Z0-9]{12})[A-Z0-9]*\}"
+    )
+    _mt_32a_pattern = re.compile(r":32A:([A-Z0-9,.]+)")
+    # Field 32A value date YYMMDD; month and day ranges are checked here, day-of-month
+    # against the calendar in _is_mt_date
+    _mt_date_pattern = re.compile(r"([0-9]{2})(0[1-9]|1[0-2])(0[1-9]|[12][0-9]|3[01])")
+    _uuid_hex_delete_table = str.maketrans("", "", "0123456789abcdefABCDEF-")
 
     @staticmethod
     def _validate_uetr(uetr: Optional[str]) -> Optional[str]:
@@ -25,25 +97,60 @@ class Validator:
         if not uetr:
             return None
 
-        if not Validator._uuid4_pattern.match(uetr):
+        # Fixed-shape check: hyphens at 8/13/18/23, version nibble 4, RFC 4122 variant, and
+        # nothing left once hex digits and hyphens are deleted in one C-level translate pass
+        if not (
+            len(uetr) == 36
+            and uetr[8] == uetr[13] == uetr[18] == uetr[23] == "-"
+            and uetr.count("-") == 4
+            and uetr[14] == "4"
+            and uetr[19] in "89abAB"
+            and not uetr.translate(Validator._uuid_hex_delete_table)
+        ):
             return f"Invalid UETR format: '{uetr}'. Must be a valid UUIDv4 string."
 
         return None
 
     @staticmethod
+    def _is_bic(bic: str) -> bool:
+        """
+        Checks the ISO 9362 shape: 6 uppercase letters, then 2 or 5 uppercase alphanumerics.
+
+        Uses str character-class predicates instead of a regex. They are ASCII-safe
+        because of the isascii() guard.
+        """
+        if len(bic) not in (8, 11) or not bic.isascii():
+            return False
+        head, tail = bic[:6], bic[6:]
+        return (
+            head.isalpha()
+            and head.isupper()
+            and tail.isalnum()
+            and (tail.isdigit() or tail.isupper())
+        )
+
+    @staticmethod
+    def register_known_bics(bics: Iterable[str]) -> None:
+        """
+        Registers a directory of known-good BICs (e.g. loaded from a SWIFT BIC directory
+        export). Registered BICs are accepted with a single set lookup before any
+        structural check. Replaces any previously registered directory.
+        """
+        Validator._known_bics = frozenset(bic.strip() for bic in bics if bic and bic.strip())
+        Validator._validate_bic.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def _validate_bic(bic: Optional[str]) -> Optional[str]:
         """
         Validates ISO 9362 BIC formatting strictly mapping to 8 or 11
-        alphanumeric constraints.
+        alphanumeric constraints. Results are cached per BIC string.
         """
-        if not bic:
+        if not bic or bic in Validator._known_bics:
             return None
 
-        if not Validator._bic_pattern.match(bic):
-            return (
-                f"Invalid BIC format: '{bic}'. Must securely match ISO 9362 "
-                "standard 8 or 11 characters."
-            )
+        if not Validator._is_bic(bic):
+            return Validator._bic_error.format(bic)
 
         return None
 
@@ -56,60 +163,174 @@ class Validator:
         """
         if not iban:
             return False
-            
+        return Validator._has_iban_prefix(iban if iban.isupper() else iban.upper())
+
+    @staticmethod
+    def _has_iban_prefix(upper_iban: str) -> bool:
+        """
+        Applies the IBAN heuristic to an already uppercased account string.
+        """
         # For the heuristic check ONLY, we strip out everything to see if it even remotely 
         # resembles an IBAN in its core alphanumeric structure. We do this so that malicious 
         # formatting (like newlines) doesn't bypass validation by tricking the engine into 
         # thinking it's not an IBAN account field at all.
-        clean_iban = Validator._iban_clean_pattern.sub("", iban.upper())
-        prefix_match = re.match(r"\A[A-Z]{2}[0-9]{2}", clean_iban)
-        return bool(prefix_match)
+        clean_iban = (
+            upper_iban
+            if upper_iban.isalnum() and upper_iban.isascii()
+            else upper_iban.encode("ascii", "ignore")
+            .translate(None, Validator._iban_non_alnum_bytes)
+            .decode("ascii")
+        )
+        # clean_iban only holds ASCII A-Z/0-9 here, so the str predicates are exact
+        return len(clean_iban) >= 4 and clean_iban[:2].isalpha() and clean_iban[2:4].isdigit()
 
     @staticmethod
+    @lru_cache(maxsize=16384)
     def _validate_iban_checksum(iban: str) -> Optional[str]:
         """
         Validates an International Bank Account Number (IBAN) using the
         Modulo-97 algorithm.
         Returns None if valid, or an error string if invalid.
+
+        Results are cached per account string, since batches from the same
+        corridor keep presenting the same debtor/creditor IBANs.
         """
         if not iban:
             return None
 
+        # Parser output is usually already normalised, so only allocate when the data is dirty
+        formatted_iban = iban.strip()
+        if not formatted_iban.isupper():
+            formatted_iban = formatted_iban.upper()
+        return Validator._iban_error(iban, formatted_iban)
+
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _normalize_and_validate_iban(account: str) -> Tuple[bool, Optional[str]]:
+        """
+        Runs the IBAN heuristic and, if it matches, the full checksum validation
+        from a single uppercasing of the account string.
+        Returns (looked_like_iban, error_or_none).
+        """
+        if not account:
+            return False, None
+        upper_account = account if account.isupper() else account.upper()
+        if not Validator._has_iban_prefix(upper_account):
+            return False, None
+        return True, Validator._iban_error(account, upper_account.strip())
+
+    @staticmethod
+    def _iban_error(iban: str, formatted_iban: str) -> Optional[str]:
+        """
+        Checks a stripped, uppercased IBAN and returns the error message for the
+        original input, or None if it is valid.
+        """
         # Pre-check: Reject excessively long strings immediately
         if len(iban) > 100:
              return f"Invalid IBAN structure: excessively long string rejected."
 
-        # 1. Sanitize only standard formatting characters (spaces, hyphens, and dots)
-        cleaner_pattern = re.compile(r"[ \-\.]")
-        formatted_iban = cleaner_pattern.sub("", iban.strip().upper())
-
-        # 2. Strict ISO 13616 Format check on the resulting alphanumeric string
+        # 1. Strict ISO 13616 format check fused with the Modulo-97 computation;
+        # separators (spaces, hyphens, dots) are skipped during the scan.
         # This catches injections, null bytes, special characters, and invalid lengths
-        if not Validator._iban_format_pattern.match(formatted_iban) or "\n" in formatted_iban or "\r" in formatted_iban:
+        remainder = Validator._iban_mod97(formatted_iban)
+        if remainder is None:
              return f"Invalid IBAN format: '{iban.strip()}' does not meet ISO 13616 standards or contains illegal characters."
 
-        # 3. Rearrange: move the first four characters to the end
-        rearranged = formatted_iban[4:] + formatted_iban[:4]
+        formatted_iban = formatted_iban.translate(Validator._iban_separator_table)
 
-        # 2. Convert: replace letters with digits (A=10, B=11... Z=35)
-        numeric_iban = "".join(
-            str(ord(char) - 55) if char.isalpha() else char for char in rearranged
-        )
+        # 2. Country-specific length and BBAN structure from the IBAN registry
+        structure_err = Validator._check_country_structure(iban, formatted_iban)
+        if structure_err:
+            return structure_err
 
-        # 3. Modulo 97 check: the integer modulo 97 must equal 1
-        # Python handles arbitrarily large integers, so we can cast and
-        # modulo directly without chunking.
-        try:
-            if int(numeric_iban) % 97 != 1:
+        # 3. Modulo 97 check: the rearranged IBAN modulo 97 must equal 1
+        if remainder != 1:
+            return (
+                f"Invalid IBAN checksum: '{formatted_iban}'. Failed international "
+                "Modulo-97 algorithm."
+            )
+
+        return None
+
+    @staticmethod
+    def bban_structure(country: str) -> Optional[Tuple[int, Tuple[Tuple[int, int, str], ...]]]:
+        """
+        Returns a country's registered IBAN layout, as used by the structure check.
+
+        Args:
+            country: The two-letter ISO 3166 country code (e.g. "GB").
+
+        Returns:
+            ``(iban_length, segments)``, where each segment is a ``(start, end, kind)`` slice of
+            the full IBAN that must be all digits (``kind == "n"``) or all letters
+            (``kind == "a"``); alphanumeric runs are not listed. None if the country is not
+            in the registry.
+        """
+        return _IBAN_STRUCTURES.get(country)
+
+    @staticmethod
+    def _check_country_structure(iban: str, compact_iban: str) -> Optional[str]:
+        """
+        Checks a separator-free IBAN against its country's registered length and BBAN
+        character classes. Countries missing from the registry only get the generic
+        ISO 13616 envelope check.
+        """
+        country = compact_iban[:2]
+        structure = _IBAN_STRUCTURES.get(country)
+        if structure is None:
+            return None
+
+        length, segments = structure
+        if len(compact_iban) != length:
+            return (
+                f"Invalid IBAN format: '{iban.strip()}' has {len(compact_iban)} characters; "
+                f"{country} IBANs have {length}."
+            )
+        for start, end, kind in segments:
+            part = compact_iban[start:end]
+            # Input is already restricted to ASCII A-Z/0-9, so these predicates are exact
+            if not (part.isdigit() if kind == "n" else part.isalpha()):
                 return (
-                    f"Invalid IBAN checksum: '{formatted_iban}'. Failed international "
-                    "Modulo-97 algorithm."
+                    f"Invalid IBAN format: '{iban.strip()}' does not match the {country} "
+                    f"BBAN structure {_IBAN_BBAN_FORMATS[country]}."
                 )
-        except ValueError:
-            return f"Invalid IBAN structure: '{formatted_iban}'. Could not evaluate checksum."
-
         return None
 
+    @staticmethod
+    def _iban_mod97(iban: str) -> Optional[int]:
+        """
+        Scans an uppercase IBAN once, skipping separators, and returns its ISO 7064
+        Mod 97-10 remainder, or None if it is not shaped like an ISO 13616 IBAN.
+
+        The remainder of the rearranged form (BBAN followed by the 4-character head) is
+        streamed through primitive ints; letters count as two digits (A=10 ... Z=35).
+        The head is always 2 letters + 2 digits, i.e. 6 decimal digits, so it is folded
+        in at the end as ``remainder * 10**6 + head``.
+        """
+        char_values = Validator._iban_char_values
+        length = 0
+        head = 0
+        remainder = 0
+        for ch in iban:
+            entry = char_values.get(ch)
+            if entry is None:
+                return None
+            value, scale = entry
+            if scale == 0:  # separator
+                continue
+            if length < 4:
+                # Country code letters first, then the two check digits
+                if (scale == 10) != (length >= 2):
+                    return None
+                head = head * scale + value
+            else:
+                remainder = (remainder * scale + value) % 97
+            length += 1
+
+        if not 15 <= length <= 34:
+            return None
+        return (remainder * 1_000_000 + head) % 97
+
     @staticmethod
     def _validate_mt_bic(bic: str, block_name: str) -> Optional[str]:
         """
@@ -118,10 +339,28 @@ class Validator:
         if not bic or len(bic) < 8:
             return f"Invalid BIC in {block_name}: too short."
         # Standard BIC is 8 or 11. headers often have 'X' padding or branch codes.
-        if not Validator._bic_pattern.match(bic[:8] + (bic[8:11] if len(bic) >= 11 else "")):
+        if not Validator._is_bic(bic[:8] + (bic[8:11] if len(bic) >= 11 else "")):
             return f"Invalid BIC format in {block_name}: '{bic}'."
         return None
 
+    @staticmethod
+    def _is_mt_date(value: str) -> bool:
+        """
+        Checks a six-character YYMMDD date as ``datetime.strptime(value, "%y%m%d")`` would
+        for the characters a 32A match can hold (strptime also takes space-padded days),
+        without strptime's per-call format parsing and locale handling.
+        """
+        match = Validator._mt_date_pattern.fullmatch(value)
+        if match is None:
+            return False
+        yy, mm, dd = (int(part) for part in match.groups())
+        try:
+            # Same century pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx
+            datetime(1900 + yy if yy >= 69 else 2000 + yy, mm, dd)
+        except ValueError:
+            return False
+        return True
+
     @staticmethod
     def _validate_mt_32a(content: str) -> Optional[str]:
         """
@@ -135,10 +374,7 @@ class Validator:
         amount_part = content[9:].replace(",", ".")
 
         # Date check
-        try:
-            from datetime import datetime
-            datetime.strptime(date_part, "%y%m%d")
-        except ValueError:
+        if not Validator._is_mt_date(date_part):
             return f"Invalid date in Field 32A: '{date_part}'. Expected YYMMDD."
 
         # Currency check
@@ -153,6 +389,82 @@ class Validator:
 
         return None
 
+    @staticmethod
+    def _find_mt_header_bics(text_data: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns the 12-character BICs of the first well-formed Block 1 and Block 2 headers.
+
+        Neither header pattern can contain '{', so matches never overlap and a single
+        finditer pass yields the same first matches as two separate searches. The scan
+        stops as soon as both headers have been seen.
+        """
+        b1_bic = b2_bic = None
+        for match in Validator._mt_header_pattern.finditer(text_data):
+            bic = match.group("b1_bic")
+            if bic is not None:
+                if b1_bic is None:
+                    b1_bic = bic
+            elif b2_bic is None:
+                b2_bic = match.group("b2_bic")
+            if b1_bic is not None and b2_bic is not None:
+                break
+        return b1_bic, b2_bic
+
+    @staticmethod
+    def _find_mt_block4(text_data: str) -> Optional[str]:
+        """
+        Extracts the Block 4 body between '{4:' + newline and the closing newline + '-}'.
+
+        Matches the same span as a non-greedy DOTALL regex (optional '\\r' before either
+        newline) but uses linear substring searches, so adversarial bodies cannot trigger
+        regex backtracking.
+        """
+        start = text_data.find("{4:")
+        while start != -1:
+            body_start = start + 3
+            if text_data.startswith("\r\n", body_start):
+                body_start += 2
+            elif text_data.startswith("\n", body_start):
+                body_start += 1
+            else:
+                start = text_data.find("{4:", start + 1)
+                continue
+
+            # The body holds at least one character before the terminator
+            body_end = text_data.find("\n-}", body_start + 1)
+            if body_end == -1:
+                return None
+            if body_end - 1 > body_start and text_data[body_end - 1] == "\r":
+                body_end -= 1
+            return text_data[body_start:body_end]
+        return None
+
+    @staticmethod
+    def detect_format(raw_data: bytes) -> Optional[str]:
+        """
+        Sniffs whether a raw payload is ISO 20022 XML or SWIFT MT.
+
+        Args:
+            raw_data: The raw message bytes.
+
+        Returns:
+            "xml", "mt", or None if the payload matches neither.
+        """
+        # Route on the leading bytes; plain ASCII-compatible payloads need no decode
+        head = raw_data.lstrip()
+        if head.startswith(b"<"):
+            return "xml"
+        if head.startswith(b"{1:"):
+            return "mt"
+
+        # BOM-prefixed or wide (NUL in the first code unit) payloads can't be read byte-wise,
+        # so fall back to decoding; lxml picks the real encoding up from the BOM itself
+        if head.startswith(_BOMS) or b"\x00" in head[:4]:
+            text_data = raw_data.decode("utf-8", errors="ignore").replace("\x00", "")
+            if text_data.lstrip("\ufeff \t\r\n").startswith("<"):
+                return "xml"
+        return None
+
     @staticmethod
     def validate_schema(raw_data: bytes) -> ValidationReport:
         """
@@ -160,50 +472,49 @@ class Validator:
         For XML (ISO 20022), validates against rigorous XSD definitions.
         For SWIFT MT, validates strictly against Block 1-5 structural rules.
         """
-        from openpurse.parser import OpenPurseParser
+        message_format = Validator.detect_format(raw_data)
 
-        text_data = raw_data.decode("utf-8", errors="ignore").strip()
+        # 1. XML Routing (the XML parser decodes the payload itself). Imported here so
+        # MT-only callers never load the parser module.
+        if message_format == "xml":
+            from openpurse.parser import OpenPurseParser
 
-        # 1. XML Routing
-        if text_data.startswith("<?xml") or text_data.startswith("<"):
             parser = OpenPurseParser(raw_data)
             return parser.validate_schema()
 
         # 2. SWIFT MT Routing
-        if text_data.startswith("{1:"):
+        if message_format == "mt":
+            text_data = raw_data.decode("utf-8", errors="ignore").strip()
             errors = []
             
+            b1_bic, b2_bic = Validator._find_mt_header_bics(text_data)
+
             # Block 1 Check: Basic Header {1:F01[BIC12]xxxx......}
-            b1_match = re.search(r"\{1:([A-Z0-9]{3})([A-Z0-9]{12})([0-9]{10})\}", text_data)
-            if not b1_match:
+            if b1_bic is None:
                 errors.append("Invalid or missing Block 1 (Basic Header) structure.")
             else:
-                bic = b1_match.group(2)[:11].strip()
-                err = Validator._validate_mt_bic(bic, "Block 1")
+                err = Validator._validate_mt_bic(b1_bic[:11].strip(), "Block 1")
                 if err: errors.append(err)
 
             # Block 2 Check: Application Header {2:I103[BIC12]XXXXN...}
-            b2_match = re.search(r"\{2:([IO])([0-9]{3})([A-Z0-9]{12})([A-Z0-9]*)?\}", text_data)
-            if not b2_match:
+            if b2_bic is None:
                 errors.append("Invalid or missing Block 2 (Application Header) structure.")
             else:
-                bic = b2_match.group(3)[:11].strip()
-                err = Validator._validate_mt_bic(bic, "Block 2")
+                err = Validator._validate_mt_bic(b2_bic[:11].strip(), "Block 2")
                 if err: errors.append(err)
 
             # Block 4 Check: Message Body
-            block4_match = re.search(r"\{4:\r?\n(.+?)\r?\n-\}", text_data, re.DOTALL)
-            if not block4_match:
+            body = Validator._find_mt_block4(text_data)
+            if body is None:
                 errors.append("Invalid or missing Block 4 (Message Body). Must cleanly terminate with '-}'.")
             else:
-                body = block4_match.group(1)
                 # Field 20 is mandatory in almost all messages
                 if ":20:" not in body:
                     errors.append("Mandatory Field :20: (Sender's Reference) missing in Block 4.")
                 
                 # Check 32A if present
                 if ":32A:" in body:
-                    match_32a = re.search(r":32A:([A-Z0-9,.]+)", body)
+                    match_32a = Validator._mt_32a_pattern.search(body)
                     if match_32a:
                         err = Validator._validate_mt_32a(match_32a.group(1))
                         if err: errors.append(err)
@@ -217,6 +528,20 @@ class Validator:
             errors=["Unrecognized message format. Payload does not match XML or SWIFT MT structures."],
         )
 
+    @staticmethod
+    def _is_blank(value: Any) -> bool:
+        """
+        Returns True for a present value that is empty or whitespace-only once stringified.
+        Strings are checked in place; numbers (int, float, Decimal) are never blank.
+        """
+        if value is None:
+            return False
+        if isinstance(value, str):
+            return not value or value.isspace()
+        if isinstance(value, (int, float, Decimal)):
+            return False
+        return str(value).strip() == ""
+
     @staticmethod
     def validate(message: PaymentMessage) -> ValidationReport:
         """
@@ -227,69 +552,80 @@ class Validator:
         errors = []
 
         # 1. Core routing constraints mapped against generic properties
-        sender_err = Validator._validate_bic(message.sender_bic)
-        if sender_err:
-            errors.append(f"[Sender] {sender_err}")
-
-        receiver_err = Validator._validate_bic(message.receiver_bic)
-        if receiver_err:
-            errors.append(f"[Receiver] {receiver_err}")
+        for label, bic in (("Sender", message.sender_bic), ("Receiver", message.receiver_bic)):
+            bic_err = Validator._validate_bic(bic)
+            if bic_err:
+                errors.append(f"[{label}] {bic_err}")
 
         uetr_err = Validator._validate_uetr(message.uetr)
         if uetr_err:
             errors.append(f"[UETR] {uetr_err}")
 
-        if message.end_to_end_id is not None and str(message.end_to_end_id).strip() == "":
-            errors.append("end_to_end_id is present but is an empty string.")
-
-        if message.amount is not None:
-            amt_str = str(message.amount).strip()
-            if amt_str == "":
-                errors.append("amount is present but is an empty string.")
-
-        if message.currency is not None:
-            curr_str = str(message.currency).strip()
-            if curr_str == "":
-                errors.append("currency is present but is an empty string.")
-            elif len(curr_str) != 3 or not curr_str.isalpha():
+        is_blank = Validator._is_blank
+        for field_name, value in (
+            ("end_to_end_id", message.end_to_end_id),
+            ("amount", message.amount),
+            ("currency", message.currency),
+        ):
+            if is_blank(value):
+                errors.append(f"{field_name} is present but is an empty string.")
+
+        currency = message.currency
+        if currency is not None and not is_blank(currency):
+            curr_str = currency.strip() if isinstance(currency, str) else str(currency).strip()
+            if len(curr_str) != 3 or not (curr_str.isascii() and curr_str.isalpha()):
                 errors.append(f"currency must be exactly 3 alphabetical characters, found: '{curr_str}'")
         # 2. Dynamic specific attribute IBAN extraction checks
         # Pacs008, Pain001, Pain008, etc. inherently provide debtor/creditor
         # explicit elements if loaded fully
-        if hasattr(message, "debtor_account"):
-            debtor_acct = getattr(message, "debtor_account")
-            if debtor_acct and Validator._is_likely_iban(debtor_acct):
-                iban_err = Validator._validate_iban_checksum(debtor_acct)
-                if iban_err:
-                    errors.append(f"[Debtor Account] {iban_err}")
-
-        if hasattr(message, "creditor_account"):
-            creditor_acct = getattr(message, "creditor_account")
-            if creditor_acct and Validator._is_likely_iban(creditor_acct):
-                iban_err = Validator._validate_iban_checksum(creditor_acct)
-                if iban_err:
-                    errors.append(f"[Creditor Account] {iban_err}")
+        for label, account in (
+            ("Debtor Account", getattr(message, "debtor_account", None)),
+            ("Creditor Account", getattr(message, "creditor_account", None)),
+        ):
+            if account:
+                looked_like_iban, iban_err = Validator._normalize_and_validate_iban(account)
+                if looked_like_iban and iban_err:
+                    errors.append(f"[{label}] {iban_err}")
 
         # Expanded nested mappings across multi-transaction messages
         # In detailed models like Pacs008Message, we also want to check nested
         # transactions if possible, but the base Validator aims for surface
         # level validation first.
         # Future enhancement: iterate entries/transactions.
-        if hasattr(message, "transactions") and isinstance(getattr(message, "transactions"), list):
-            for i, tx in enumerate(getattr(message, "transactions")):
+        transactions = getattr(message, "transactions", None)
+        if isinstance(transactions, list):
+            # Collect every tagged account first, then validate each distinct string once:
+            # bulk files typically repeat one debtor account across all their transactions
+            tagged_accounts = []
+            for i, tx in enumerate(transactions):
                 if isinstance(tx, dict):
-                    if "debtor_account" in tx:
-                        tx_db_acct = tx["debtor_account"]
-                        if tx_db_acct and Validator._is_likely_iban(tx_db_acct):
-                            err = Validator._validate_iban_checksum(tx_db_acct)
-                            if err:
-                                errors.append(f"[Transaction {i} Debtor Account] {err}")
-                    if "creditor_account" in tx:
-                        tx_cr_acct = tx["creditor_account"]
-                        if tx_cr_acct and Validator._is_likely_iban(tx_cr_acct):
-                            err = Validator._validate_iban_checksum(tx_cr_acct)
-                            if err:
-                                errors.append(f"[Transaction {i} Creditor Account] {err}")
+                    for key, label in (
+                        ("debtor_account", "Debtor Account"),
+                        ("creditor_account", "Creditor Account"),
+                    ):
+                        tx_acct = tx.get(key)
+                        if tx_acct:
+                            tagged_accounts.append((i, label, tx_acct))
+
+            check_iban = Validator._normalize_and_validate_iban
+            results = {acct: check_iban(acct) for acct in {acct for _, _, acct in tagged_accounts}}
+            for i, label, tx_acct in tagged_accounts:
+                looked_like_iban, err = results[tx_acct]
+                if looked_like_iban and err:
+                    errors.append(f"[Transaction {i} {label}] {err}")
 
         is_valid = len(errors) == 0
         return ValidationReport(is_valid=is_valid, errors=errors)
+
+    @staticmethod
+    def validate_batch(messages: Iterable[PaymentMessage]) -> List[ValidationReport]:
+        """
+        Validates a batch of parsed messages, returning one ValidationReport per message
+        in input order.
+
+        Batches from the same corridor repeat a small set of BICs and accounts, so after
+        the first occurrence those checks are served from the memoised validators and
+        each message costs little more than its attribute reads.
+        """
+        validate = Validator.validate
+        return [validate(message) for message in messages]
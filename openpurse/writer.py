@@ -1,34 +1,84 @@
+import sys
 import uuid
 from typing import Any, Dict, Optional, Union
 from lxml import etree
 
 from openpurse.models import PaymentMessage, Pacs008Message, Pain001Message
 
+# PostalAddress attribute -> PstlAdr child tag, in schema order (AdrLine is repeated, see below)
+_PSTL_FIELDS = (
+    ("country", "Ctry"),
+    ("town_name", "TwnNm"),
+    ("post_code", "PstCd"),
+    ("street_name", "StrtNm"),
+    ("building_number", "BldgNb"),
+)
+
+
+class _QualifiedTags(dict):
+    """
+    Lazily maps local ISO 20022 tag names to interned Clark-notation ``{ns}Tag`` strings
+    for one namespace, so each qualified tag is built once per process, not per element.
+    """
+
+    def __init__(self, namespace: str):
+        super().__init__()
+        self.prefix = f"{{{namespace}}}"
+
+    def __missing__(self, tag: str) -> str:
+        qualified = self[tag] = sys.intern(self.prefix + tag)
+        return qualified
+
+
+# One tag table per target namespace, shared by every XMLWriter for that schema
+_TAG_TABLES: Dict[str, _QualifiedTags] = {}
+
 
 class XMLWriter:
     """
     A programmatic engine to compile OpenPurse data models into strict
     ISO 20022 XML formats (lxml byte streams).
+
+    Trees are grown strictly top-down with ``etree.SubElement`` (via ``_sub``): the only
+    free-standing ``etree.Element`` is the Document root. Never build fragments elsewhere
+    and ``append()`` them in, since moving nodes between documents makes lxml re-walk
+    the subtree and serialisation of large batches degrades to quadratic time.
     """
 
-    def __init__(self, schema: str = "pacs.008.001.08"):
+    def __init__(self, schema: str = "pacs.008.001.08", pretty: bool = False):
         """
         Initializes the XML Writer for a target ISO 20022 schema.
-        
+
         Args:
             schema: The full ISO 20022 schema identifier (e.g., 'pacs.008.001.08').
+            pretty: Indent the serialised output for human reading. Off by default, since
+                machine-to-machine payloads gain nothing from the extra whitespace.
         """
         self.schema = schema
+        self.pretty = pretty
         self.namespace = f"urn:iso:std:iso:20022:tech:xsd:{schema}"
         self.nsmap = {None: self.namespace}
-
-    def to_xml(self, message: Union[PaymentMessage, Pacs008Message, Pain001Message]) -> bytes:
+        self._tags = _TAG_TABLES.get(self.namespace)
+        if self._tags is None:
+            self._tags = _TAG_TABLES[self.namespace] = _QualifiedTags(self.namespace)
+
+    def to_xml(
+        self,
+        message: Union[PaymentMessage, Pacs008Message, Pain001Message],
+        canonical: bool = False,
+    ) -> bytes:
         """
         Parses the unified PaymentMessage model into a strict lxml tree map
         and returns the encoded byte string.
+
+        Args:
+            message: The payment model to serialise.
+            canonical: Emit Canonical XML 2.0 (C14N 2.0) directly, e.g. for digest or
+                signature input, instead of a declared (and optionally pretty) document.
+                Canonical output has no XML declaration and ignores ``pretty``.
         """
         # Create Root Document
-        document = etree.Element("Document", nsmap=self.nsmap)
+        document = etree.Element(self._tags["Document"], nsmap=self.nsmap)
 
         if "pacs.008" in self.schema:
             self._build_pacs008(document, message)
@@ -37,189 +87,151 @@ class XMLWriter:
         else:
             raise NotImplementedError(f"XML generation for {self.schema} is not yet supported.")
 
+        if canonical:
+            return etree.tostring(document, method="c14n2")
+
         return etree.tostring(
             document,
-            pretty_print=True,
+            pretty_print=self.pretty,
             xml_declaration=True,
             encoding="UTF-8"
         )
 
+    def _sub(
+        self, parent: etree._Element, tag: str, text: Optional[str] = None, **attrs: str
+    ) -> etree._Element:
+        """
+        Appends a namespace-qualified child element with optional text and attributes.
+        """
+        tag = self._tags[tag]
+        element = etree.SubElement(parent, tag, attrs) if attrs else etree.SubElement(parent, tag)
+        if text is not None:
+            element.text = text
+        return element
+
+    def _build_agent(self, parent: etree._Element, tag: str, bic: str):
+        """Builds a <tag><FinInstnId><BICFI/></FinInstnId></tag> agent node."""
+        self._sub(self._sub(self._sub(parent, tag), "FinInstnId"), "BICFI", bic)
+
+    def _build_party(self, parent: etree._Element, tag: str, name: Optional[str], address: Any):
+        """Builds a <tag><Nm/><PstlAdr/></tag> party node; skipped entirely without a name."""
+        if name:
+            party = self._sub(parent, tag)
+            self._sub(party, "Nm", name)
+            if address:
+                self._build_postal_address(party, address)
+
     def _build_pacs008(self, root: etree.Element, message: Union[PaymentMessage, Pacs008Message]):
         """Builds the FIToFICstmrCdtTrf node for a pacs.008 payload."""
-        fi_to_fi = etree.SubElement(root, "FIToFICstmrCdtTrf")
+        sub = self._sub
+        fi_to_fi = sub(root, "FIToFICstmrCdtTrf")
 
         # Group Header
-        grp_hdr = etree.SubElement(fi_to_fi, "GrpHdr")
+        grp_hdr = sub(fi_to_fi, "GrpHdr")
         if message.message_id:
-            msg_id = etree.SubElement(grp_hdr, "MsgId")
-            msg_id.text = message.message_id
-            
+            sub(grp_hdr, "MsgId", message.message_id)
+
         if message.number_of_transactions is not None:
-            nb_of_txs = etree.SubElement(grp_hdr, "NbOfTxs")
-            nb_of_txs.text = str(message.number_of_transactions)
+            sub(grp_hdr, "NbOfTxs", str(message.number_of_transactions))
 
         # Settlement Info
         if getattr(message, "settlement_method", None):
-            sttlm_inf = etree.SubElement(grp_hdr, "SttlmInf")
-            sttlm_mtd = etree.SubElement(sttlm_inf, "SttlmMtd")
-            sttlm_mtd.text = message.settlement_method
-            
+            sub(sub(grp_hdr, "SttlmInf"), "SttlmMtd", message.settlement_method)
+
         # Instructing Agents
         if message.sender_bic:
-            instg_agt = etree.SubElement(grp_hdr, "InstgAgt")
-            fin_instn_id = etree.SubElement(instg_agt, "FinInstnId")
-            bicfi = etree.SubElement(fin_instn_id, "BICFI")
-            bicfi.text = message.sender_bic
+            self._build_agent(grp_hdr, "InstgAgt", message.sender_bic)
 
         if message.receiver_bic:
-            instd_agt = etree.SubElement(grp_hdr, "InstdAgt")
-            fin_instn_id = etree.SubElement(instd_agt, "FinInstnId")
-            bicfi = etree.SubElement(fin_instn_id, "BICFI")
-            bicfi.text = message.receiver_bic
+            self._build_agent(grp_hdr, "InstdAgt", message.receiver_bic)
 
         # Credit Transfer Transaction Info
-        tx_inf = etree.SubElement(fi_to_fi, "CdtTrfTxInf")
-        pmt_id = etree.SubElement(tx_inf, "PmtId")
+        tx_inf = sub(fi_to_fi, "CdtTrfTxInf")
+        pmt_id = sub(tx_inf, "PmtId")
 
         if message.end_to_end_id:
-            e2e_id = etree.SubElement(pmt_id, "EndToEndId")
-            e2e_id.text = message.end_to_end_id
+            sub(pmt_id, "EndToEndId", message.end_to_end_id)
 
         if message.uetr:
-            uetr_el = etree.SubElement(pmt_id, "UETR")
-            uetr_el.text = message.uetr
-
-        if message.amount:
-            amt = etree.SubElement(tx_inf, "IntrBkSttlmAmt")
-            amt.text = message.amount
-            if message.currency:
-                amt.set("Ccy", message.currency)
-
-        # Debtor
-        if message.debtor_name:
-            dbtr = etree.SubElement(tx_inf, "Dbtr")
-            nm = etree.SubElement(dbtr, "Nm")
-            nm.text = message.debtor_name
+            sub(pmt_id, "UETR", message.uetr)
 
-            if message.debtor_address:
-                self._build_postal_address(dbtr, message.debtor_address)
-
-        # Creditor
-        if message.creditor_name:
-            cdtr = etree.SubElement(tx_inf, "Cdtr")
-            nm = etree.SubElement(cdtr, "Nm")
-            nm.text = message.creditor_name
-
-            if message.creditor_address:
-                self._build_postal_address(cdtr, message.creditor_address)
+        amount, currency = message.amount, message.currency
+        if amount:
+            if currency:
+                sub(tx_inf, "IntrBkSttlmAmt", amount, Ccy=currency)
+            else:
+                sub(tx_inf, "IntrBkSttlmAmt", amount)
 
+        # Debtor / Creditor
+        self._build_party(tx_inf, "Dbtr", message.debtor_name, message.debtor_address)
+        self._build_party(tx_inf, "Cdtr", message.creditor_name, message.creditor_address)
 
     def _build_pain001(self, root: etree.Element, message: Union[PaymentMessage, Pain001Message]):
         """Builds the CstmrCdtTrfInitn node for a pain.001 payload."""
-        cstmr_cdt = etree.SubElement(root, "CstmrCdtTrfInitn")
+        sub = self._sub
+        cstmr_cdt = sub(root, "CstmrCdtTrfInitn")
 
         # GrpHdr
-        grp_hdr = etree.SubElement(cstmr_cdt, "GrpHdr")
+        grp_hdr = sub(cstmr_cdt, "GrpHdr")
         if message.message_id:
-            msg_id = etree.SubElement(grp_hdr, "MsgId")
-            msg_id.text = message.message_id
+            sub(grp_hdr, "MsgId", message.message_id)
 
         if getattr(message, "number_of_transactions", None) is not None:
-            nb_of_txs = etree.SubElement(grp_hdr, "NbOfTxs")
-            nb_of_txs.text = str(message.number_of_transactions)
+            sub(grp_hdr, "NbOfTxs", str(message.number_of_transactions))
 
         if getattr(message, "control_sum", None) is not None:
-            ctrl_sum = etree.SubElement(grp_hdr, "CtrlSum")
-            ctrl_sum.text = str(message.control_sum)
+            sub(grp_hdr, "CtrlSum", str(message.control_sum))
 
         if getattr(message, "initiating_party", None):
-            initg_pty = etree.SubElement(grp_hdr, "InitgPty")
-            nm = etree.SubElement(initg_pty, "Nm")
-            nm.text = message.initiating_party
+            sub(sub(grp_hdr, "InitgPty"), "Nm", message.initiating_party)
 
         # PmtInf
-        pmt_inf = etree.SubElement(cstmr_cdt, "PmtInf")
-        if message.end_to_end_id:
-            pmt_inf_id = etree.SubElement(pmt_inf, "PmtInfId")
-            pmt_inf_id.text = f"PMTINF-{message.end_to_end_id}"
+        pmt_inf = sub(cstmr_cdt, "PmtInf")
+        end_to_end_id = message.end_to_end_id
+        if end_to_end_id:
+            sub(pmt_inf, "PmtInfId", f"PMTINF-{end_to_end_id}")
 
-        if message.debtor_name:
-            dbtr = etree.SubElement(pmt_inf, "Dbtr")
-            nm = etree.SubElement(dbtr, "Nm")
-            nm.text = message.debtor_name
-            if message.debtor_address:
-                self._build_postal_address(dbtr, message.debtor_address)
+        self._build_party(pmt_inf, "Dbtr", message.debtor_name, message.debtor_address)
 
         if message.debtor_account:
-            dbtr_acct = etree.SubElement(pmt_inf, "DbtrAcct")
-            id_node = etree.SubElement(dbtr_acct, "Id")
-            iban_node = etree.SubElement(id_node, "IBAN")
-            iban_node.text = message.debtor_account
+            sub(sub(sub(pmt_inf, "DbtrAcct"), "Id"), "IBAN", message.debtor_account)
 
         if message.sender_bic:
-            dbtr_agt = etree.SubElement(pmt_inf, "DbtrAgt")
-            fin_instn_id = etree.SubElement(dbtr_agt, "FinInstnId")
-            bicfi = etree.SubElement(fin_instn_id, "BICFI")
-            bicfi.text = message.sender_bic
+            self._build_agent(pmt_inf, "DbtrAgt", message.sender_bic)
 
         # CdtTrfTxInf
-        tx_inf = etree.SubElement(pmt_inf, "CdtTrfTxInf")
-        pmt_id = etree.SubElement(tx_inf, "PmtId")
-        if message.end_to_end_id:
-            e2e_id = etree.SubElement(pmt_id, "EndToEndId")
-            e2e_id.text = message.end_to_end_id
-
-        if message.amount:
-            amt = etree.SubElement(tx_inf, "Amt")
-            instd_amt = etree.SubElement(amt, "InstdAmt")
-            instd_amt.text = message.amount
-            if message.currency:
-                instd_amt.set("Ccy", message.currency)
+        tx_inf = sub(pmt_inf, "CdtTrfTxInf")
+        pmt_id = sub(tx_inf, "PmtId")
+        if end_to_end_id:
+            sub(pmt_id, "EndToEndId", end_to_end_id)
+
+        amount, currency = message.amount, message.currency
+        if amount:
+            amt = sub(tx_inf, "Amt")
+            if currency:
+                sub(amt, "InstdAmt", amount, Ccy=currency)
+            else:
+                sub(amt, "InstdAmt", amount)
 
         if message.receiver_bic:
-            cdtr_agt = etree.SubElement(tx_inf, "CdtrAgt")
-            fin_instn_id = etree.SubElement(cdtr_agt, "FinInstnId")
-            bicfi = etree.SubElement(fin_instn_id, "BICFI")
-            bicfi.text = message.receiver_bic
-
-        if message.creditor_name:
-            cdtr = etree.SubElement(tx_inf, "Cdtr")
-            nm = etree.SubElement(cdtr, "Nm")
-            nm.text = message.creditor_name
-            if message.creditor_address:
-                self._build_postal_address(cdtr, message.creditor_address)
+            self._build_agent(tx_inf, "CdtrAgt", message.receiver_bic)
+
+        self._build_party(tx_inf, "Cdtr", message.creditor_name, message.creditor_address)
 
         if message.creditor_account:
-            cdtr_acct = etree.SubElement(tx_inf, "CdtrAcct")
-            id_node = etree.SubElement(cdtr_acct, "Id")
-            iban_node = etree.SubElement(id_node, "IBAN")
-            iban_node.text = message.creditor_account
+            sub(sub(sub(tx_inf, "CdtrAcct"), "Id"), "IBAN", message.creditor_account)
 
     def _build_postal_address(self, parent: etree.Element, address: Any):
         """Builds a PstlAdr node."""
-        pstl_adr = etree.SubElement(parent, "PstlAdr")
-
-        if getattr(address, "country", None):
-            ctry = etree.SubElement(pstl_adr, "Ctry")
-            ctry.text = address.country
-
-        if getattr(address, "town_name", None):
-            twn = etree.SubElement(pstl_adr, "TwnNm")
-            twn.text = address.town_name
-
-        if getattr(address, "post_code", None):
-            pst_cd = etree.SubElement(pstl_adr, "PstCd")
-            pst_cd.text = address.post_code
-
-        if getattr(address, "street_name", None):
-            strt = etree.SubElement(pstl_adr, "StrtNm")
-            strt.text = address.street_name
-
-        if getattr(address, "building_number", None):
-            bldg = etree.SubElement(pstl_adr, "BldgNb")
-            bldg.text = address.building_number
-
-        if getattr(address, "address_lines", None):
-            for line in address.address_lines:
-                adr_line = etree.SubElement(pstl_adr, "AdrLine")
-                adr_line.text = line
+        sub = self._sub
+        pstl_adr = sub(parent, "PstlAdr")
+
+        for attr, tag in _PSTL_FIELDS:
+            value = getattr(address, attr, None)
+            if value:
+                sub(pstl_adr, tag, value)
+
+        address_lines = getattr(address, "address_lines", None)
+        if address_lines:
+            for line in address_lines:
+                sub(pstl_adr, "AdrLine", line)
@@ -1,5 +1,6 @@
 import glob
 import os
+import re
 
 import pytest
 
@@ -7,18 +8,20 @@ from openpurse.parser import OpenPurseParser
 
 # Gather all 777 XSDs at module load directly
 DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs")
-XSD_FILES = glob.glob(f"{DOCS_DIR}/**/*.xsd", recursive=True)
+# Sorted so every collector (including pytest-xdist workers) sees the same parametrization order
+XSD_FILES = sorted(glob.glob(f"{DOCS_DIR}/**/*.xsd", recursive=True))
+
+# targetNamespace sits on the xs:schema element, well inside the first couple of KB
+_NS_RE = re.compile(rb'targetNamespace="([^"]+)"')
 
 
 def extract_namespace(xsd_path):
     try:
-        with open(xsd_path, "r", encoding="utf-8") as f:
-            content = f.read(1024)
-            if 'targetNamespace="' in content:
-                return content.split('targetNamespace="')[1].split('"')[0]
-    except Exception:
-        pass
-    return None
+        with open(xsd_path, "rb") as f:
+            match = _NS_RE.search(f.read(2048))
+    except OSError:
+        return None
+    return match.group(1).decode() if match else None
 
 
 NAMESPACES = [ns for ns in (extract_namespace(xsd) for xsd in XSD_FILES) if ns]
@@ -27,19 +30,11 @@ NAMESPACES = [ns for ns in (extract_namespace(xsd) for xsd in XSD_FILES) if ns]
 assert len(NAMESPACES) > 500, f"Expected 700+ namespaces, found {len(NAMESPACES)}"
 
 
-@pytest.mark.parametrize("namespace", NAMESPACES)
-def test_universal_schema_parsing(namespace):
-    """
-    Test every single schema found in docs/ to guarantee that IF a document
-    adheres to ANY ISO 20022 schema, our generic XPaths will seamlessly
-    extract the available target data (or gracefully skip missing fields).
-    """
-
-    # We construct a mock XML blob embedding the iterated namespace.
-    # We use a generic root block, because OpenPurse uses //ns: element queries
-    # to find data regardless of depth or schema-specific root names (e.g. BkToCstmrAcctRpt).
-    mock_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Document xmlns="{namespace}">
+# Mock XML blob shared by every schema case; only the namespace is swapped in.
+# We use a generic root block, because OpenPurse uses //ns: element queries
+# to find data regardless of depth or schema-specific root names (e.g. BkToCstmrAcctRpt).
+_MOCK_TEMPLATE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Document xmlns="__NS__">
     <DummyRoot>
         <GrpHdr>
             <MsgId>MEGA_UNI_ID</MsgId>
@@ -71,8 +66,19 @@ def test_universal_schema_parsing(namespace):
     </DummyRoot>
 </Document>"""
 
+
+@pytest.mark.parametrize("namespace", NAMESPACES)
+def test_universal_schema_parsing(namespace):
+    """
+    Test every single schema found in docs/ to guarantee that IF a document
+    adheres to ANY ISO 20022 schema, our generic XPaths will seamlessly
+    extract the available target data (or gracefully skip missing fields).
+    """
+
+    mock_xml = _MOCK_TEMPLATE.replace(b"__NS__", namespace.encode())
+
     # Parse it
-    parser = OpenPurseParser(mock_xml.encode("utf-8"))
+    parser = OpenPurseParser(mock_xml)
     msg = parser.parse()
 
     # Verify accurate extraction across all schemas natively
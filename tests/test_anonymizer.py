@@ -92,3 +92,21 @@ def test_anonymizer_edge_cases():
     assert anonymizer._get_alias("") == ""
     assert anonymizer._get_alias("name", prefix="") != "name"
     assert not anonymizer._get_alias("name", prefix="").startswith("_")
+
+
+@pytest.mark.parametrize(
+    "iban",
+    ["GB90MIDL40051522334455", "NL91ABNA0417164300", "DE89370400440532013000", "NO9386011117947"],
+)
+def test_masked_iban_follows_country_bban_structure(iban):
+    masked = Anonymizer()._mask_iban(iban)
+
+    assert masked != iban
+    assert masked[:2] == iban[:2]
+    assert len(masked) == len(iban)
+    assert Validator._validate_iban_checksum(masked) is None
+
+    # Letters only where the registry asks for them (e.g. the GB/NL bank code)
+    length, segments = Validator.bban_structure(iban[:2])
+    for start, end, kind in segments:
+        assert masked[start:end].isalpha() if kind == "a" else masked[start:end].isdigit()
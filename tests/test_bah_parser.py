@@ -96,3 +96,23 @@ def test_direct_app_hdr_root():
     
     assert parsed.sender_bic == "DIRECTSEN"
     assert parsed.message_id == "DIRECT-ID"
+
+
+def test_bah_detection_in_utf16_input():
+    """
+    The AppHdr byte pre-check must not hide a header in a wide (UTF-16) encoding.
+    """
+    bah_xml = """<?xml version="1.0" encoding="UTF-16"?>
+    <BusMsg xmlns="urn:iso:std:iso:20022:tech:xsd:head.001.001.01">
+        <AppHdr>
+            <Fr><FIId><FinInstnId><BICFI>WIDESENDR</BICFI></FinInstnId></FIId></Fr>
+            <BizMsgIdr>WIDE-ID</BizMsgIdr>
+        </AppHdr>
+        <Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08">
+            <FIToFICstmrCdtTrf><GrpHdr><MsgId>WIDE-DOC</MsgId></GrpHdr></FIToFICstmrCdtTrf>
+        </Document>
+    </BusMsg>""".encode("utf-16")
+    parsed = OpenPurseParser(bah_xml).parse()
+
+    assert parsed.sender_bic == "WIDESENDR"
+    assert parsed.message_id == "WIDE-DOC"
@@ -4,50 +4,64 @@ import os
 import pytest
 import json
 
+from openpurse.cli import main
+
 EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "example_messages")
 
-def run_cli(args):
-    """Utility to run the OpenPurse CLI via subprocess."""
-    result = subprocess.run(
-        [sys.executable, "-m", "openpurse"] + args,
-        capture_output=True,
-        text=True
-    )
-    return result
+def run_cli(args, capsys):
+    """Utility to run the OpenPurse CLI in-process, mirroring a subprocess result."""
+    try:
+        main(args)
+        returncode = 0
+    except SystemExit as exc:
+        returncode = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    out, err = capsys.readouterr()
+    return subprocess.CompletedProcess(args, returncode, out, err)
 
-def test_cli_validate_success():
+def test_cli_validate_success(capsys):
     # Use a real example from the repo
     # Assuming pacs_008_example_sepa_direct_debit.xml is typical
     file_path = os.path.join(EXAMPLES_DIR, "pain_008_example_sepa_direct_debit.xml")
     if not os.path.exists(file_path):
         pytest.skip("Example file missing")
         
-    result = run_cli(["validate", file_path])
+    result = run_cli(["validate", file_path], capsys)
     assert result.returncode == 0
     assert "Validation Successful" in result.stdout
 
-def test_cli_parse_pacs008():
+def test_cli_parse_pacs008(capsys):
     file_path = os.path.join(EXAMPLES_DIR, "pain_008_example_sepa_direct_debit.xml")
     if not os.path.exists(file_path):
         pytest.skip("Example file missing")
         
-    result = run_cli(["parse", file_path])
+    result = run_cli(["parse", file_path], capsys)
     assert result.returncode == 0
     # Verify it's valid JSON and contains expected keys
     data = json.loads(result.stdout)
     assert "message_id" in data
 
-def test_cli_persist_sqlite(tmp_path):
+def test_cli_persist_sqlite(tmp_path, capsys):
     file_path = os.path.join(EXAMPLES_DIR, "pain_008_example_sepa_direct_debit.xml")
     db_file = tmp_path / "test_cli.db"
     db_url = f"sqlite:///{db_file}"
     
-    result = run_cli(["persist", file_path, "--db-url", db_url])
+    result = run_cli(["persist", file_path, "--db-url", db_url], capsys)
     assert result.returncode == 0
     assert "Successfully persisted" in result.stdout
     assert os.path.exists(db_file)
 
-def test_cli_invalid_command():
-    result = run_cli(["garbage"])
+def test_cli_invalid_command(capsys):
+    result = run_cli(["garbage"], capsys)
     assert result.returncode != 0
     assert "invalid choice" in result.stderr
+
+def test_cli_module_entrypoint():
+    """Smoke-tests the real `python -m openpurse` invocation path in a subprocess."""
+    file_path = os.path.join(EXAMPLES_DIR, "pain_008_example_sepa_direct_debit.xml")
+    result = subprocess.run(
+        [sys.executable, "-m", "openpurse", "parse", file_path],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert "message_id" in json.loads(result.stdout)
@@ -1,21 +1,38 @@
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Column, MetaData, Table, create_engine, inspect
+from sqlalchemy.orm import Session, sessionmaker
 from openpurse.models import Pacs008Message, PostalAddress, Pain001Message
-from openpurse.database.models import Base, Pacs008Record, Pain001Record
+from openpurse.database.models import (
+    Base,
+    Pacs008Record,
+    Pain001Record,
+    PaymentMessageRecord,
+    upgrade_schema,
+)
 from openpurse.database.repository import MessageRepository
 
-@pytest.fixture
-def db_session():
+@pytest.fixture(scope="module")
+def db_engine():
     """
-    Provides an in-memory SQLite database session for testing.
+    Provides an in-memory SQLite engine whose schema is created once per module.
     """
     engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db_session(db_engine):
+    """
+    Provides a session inside a transaction that is rolled back after each test.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(bind=connection)()
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 def test_save_pacs008_to_db(db_session):
     repo = MessageRepository(db_session)
@@ -68,3 +85,98 @@ def test_list_by_sender(db_session):
     # Verify polymorphic identities (Pain001Record vs Pacs008Record)
     pain_rec = next(m for m in sender1_msgs if m.message_id == "ID2")
     assert isinstance(pain_rec, Pain001Record)
+
+def test_save_many_single_flush(db_session):
+    repo = MessageRepository(db_session)
+    msgs = [
+        Pacs008Message(message_id="BATCH1", sender_bic="SENDER9", amount="1"),
+        Pain001Message(message_id="BATCH2", sender_bic="SENDER9", amount="2"),
+        Pacs008Message(message_id="BATCH3", sender_bic="SENDER9", amount="3"),
+    ]
+
+    records = repo.save_many(msgs)
+
+    assert [r.message_id for r in records] == ["BATCH1", "BATCH2", "BATCH3"]
+    assert all(r.id is not None for r in records)
+    assert isinstance(records[1], Pain001Record)
+    assert len(repo.list_by_sender("SENDER9")) == 3
+    assert repo.save_many([]) == []
+
+
+def test_insert_many_bulk_path(db_session):
+    repo = MessageRepository(db_session)
+    addr = PostalAddress(town_name="Oslo", country="NO")
+    msgs = [
+        Pacs008Message(message_id="BULK1", sender_bic="SENDER7", debtor_address=addr),
+        Pain001Message(message_id="BULK2", sender_bic="SENDER7", payment_information=[{"a": 1}]),
+    ]
+
+    assert repo.insert_many(msgs) == 2
+
+    records = {r.message_id: r for r in repo.list_by_sender("SENDER7")}
+    assert isinstance(records["BULK1"], Pacs008Record)
+    assert records["BULK1"].debtor_address["town_name"] == "Oslo"
+    assert isinstance(records["BULK2"], Pain001Record)
+    assert records["BULK2"].payment_information == [{"a": 1}]
+    assert records["BULK1"].created_at is not None
+
+
+def test_debtor_location_columns(db_session):
+    repo = MessageRepository(db_session)
+    repo.save(Pacs008Message(message_id="LOC1", debtor_address=PostalAddress(town_name="London", country="GB")))
+    repo.save_many([Pain001Message(message_id="LOC2", debtor_address=PostalAddress(country="GB"))])
+    repo.insert_many([Pacs008Message(message_id="LOC3", debtor_address=PostalAddress(town_name="Oslo", country="NO"))])
+    repo.save(Pacs008Message(message_id="LOC4"))
+
+    record = repo.get_by_message_id("LOC1")
+    assert (record.debtor_town, record.debtor_country) == ("London", "GB")
+    assert record.debtor_address["town_name"] == "London"
+
+    assert {r.message_id for r in repo.list_by_debtor_location("GB")} == {"LOC1", "LOC2"}
+    assert [r.message_id for r in repo.list_by_debtor_location("GB", town="London")] == ["LOC1"]
+    assert [r.message_id for r in repo.list_by_debtor_location("NO")] == ["LOC3"]
+    assert repo.get_by_message_id("LOC4").debtor_country is None
+
+
+def test_upgrade_schema_adds_debtor_location_columns():
+    """
+    A payment_messages table from the original schema gains the debtor location columns.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    legacy = Table(
+        "payment_messages",
+        MetaData(),
+        *(
+            Column(c.name, c.type, primary_key=c.primary_key)
+            for c in PaymentMessageRecord.__table__.columns
+            if c.name not in ("debtor_town", "debtor_country")
+        ),
+    )
+    legacy.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            legacy.insert(),
+            [
+                {
+                    "msg_type": "base",
+                    "message_id": "OLD1",
+                    "debtor_address": {"town_name": "Paris", "country": "FR"},
+                },
+                {"msg_type": "base", "message_id": "OLD2", "debtor_address": None},
+            ],
+        )
+
+    upgrade_schema(engine)
+    upgrade_schema(engine)  # Already current, so a second run changes nothing
+    Base.metadata.create_all(engine)
+
+    index_names = {ix["name"] for ix in inspect(engine).get_indexes("payment_messages")}
+    assert {"ix_payment_messages_debtor_town", "ix_payment_messages_debtor_country"} <= index_names
+
+    with Session(engine) as session:
+        repo = MessageRepository(session)
+        repo.save(Pacs008Message(message_id="NEW1", debtor_address=PostalAddress(country="FR")))
+        assert {r.message_id for r in repo.list_by_debtor_location("FR")} == {"OLD1", "NEW1"}
+        assert [r.message_id for r in repo.list_by_debtor_location("FR", town="Paris")] == ["OLD1"]
+        assert repo.get_by_message_id("OLD2").debtor_country is None
+    engine.dispose()
@@ -1,5 +1,6 @@
 import glob
 import os
+import re
 
 import pytest
 
@@ -18,19 +19,43 @@ from openpurse.parser import OpenPurseParser
 
 # Path to example messages folder
 EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "example_messages")
-EXAMPLE_FILES = glob.glob(os.path.join(EXAMPLES_DIR, "*.xml"))
+EXAMPLE_FILES = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*.xml")))
+
+# Message type named in an example's filename (e.g. "camt_053_...", "Example_pain.002...")
+_FILENAME_TYPE_RE = re.compile(
+    r"(?P<camt052>camt[._]052)|(?P<camt053>camt_?053)|(?P<camt054>camt[._]054)"
+    r"|(?P<pain001>pain[._]001)|(?P<pain002>pain[._]002)|(?P<pain008>pain[._]008)"
+    r"|(?P<pacs008>pacs[._]008)"
+)
+_FILENAME_TYPE_MODELS = {
+    "camt052": Camt052Message,
+    "camt053": Camt053Message,
+    "camt054": Camt054Message,
+    "pain001": Pain001Message,
+    "pain002": Pain002Message,
+    "pain008": Pain008Message,
+    "pacs008": Pacs008Message,
+}
+
+
+@pytest.fixture(scope="module")
+def parsed_corpus():
+    """
+    Reads and parses every example file once, shared by the parametrized tests below.
+    """
+    corpus = {}
+    for filepath in EXAMPLE_FILES:
+        with open(filepath, "rb") as f:
+            corpus[filepath] = OpenPurseParser(f.read())
+    return corpus
 
 
 @pytest.mark.parametrize("filepath", EXAMPLE_FILES)
-def test_parse_real_examples(filepath):
+def test_parse_real_examples(filepath, parsed_corpus):
     """
     Ensure the parser can read and flatten real example messages without crashing.
     """
-    with open(filepath, "rb") as f:
-        xml_data = f.read()
-
-    parser = OpenPurseParser(xml_data)
-    result = parser.flatten()
+    result = parsed_corpus[filepath].flatten()
 
     # Verify that flattening returns a dictionary
     assert isinstance(result, dict)
@@ -50,33 +75,14 @@ def test_parse_real_examples(filepath):
 
 
 @pytest.mark.parametrize("filepath", EXAMPLE_FILES)
-def test_parse_detailed_real_examples(filepath):
+def test_parse_detailed_real_examples(filepath, parsed_corpus):
     """
     Ensure the parser correctly dynamically identifies all 5 new and 3 existing examples
     and instantiates their extreme detailed dataclass models correctly.
     """
-    with open(filepath, "rb") as f:
-        xml_data = f.read()
-
-    parser = OpenPurseParser(xml_data)
-    result = parser.parse_detailed()
-
-    filename = filepath.lower()
+    result = parsed_corpus[filepath].parse_detailed()
 
-    if "camt_052" in filename or "camt.052" in filename:
-        assert isinstance(result, Camt052Message)
-    elif "camt_053" in filename or "camt053" in filename:
-        assert isinstance(result, Camt053Message)
-    elif "camt_054" in filename or "camt.054" in filename:
-        assert isinstance(result, Camt054Message)
-    elif "pain_001" in filename or "pain.001" in filename:
-        assert isinstance(result, Pain001Message)
-    elif "pain_002" in filename or "pain.002" in filename or "pain.002" in filename:
-        assert isinstance(result, Pain002Message)
-    elif "pain_008" in filename or "pain.008" in filename:
-        assert isinstance(result, Pain008Message)
-    elif "pacs.008" in filename or "pacs_008" in filename:
-        assert isinstance(result, Pacs008Message)
-    else:
-        # Default fallback
-        assert isinstance(result, PaymentMessage)
+    match = _FILENAME_TYPE_RE.search(os.path.basename(filepath).lower())
+    # Files that don't name a known type just need to yield some PaymentMessage
+    expected = _FILENAME_TYPE_MODELS[match.lastgroup] if match else PaymentMessage
+    assert isinstance(result, expected)
@@ -40,3 +40,15 @@ def test_export_json(tmp_path):
     assert path.exists()
     content = json.loads(path.read_text())
     assert content["openapi"] == "3.0.0"
+
+
+def test_cached_schemas_are_returned_as_fresh_copies():
+    spec = Exporter.to_openapi()
+    spec["paths"]["/payments"] = {}
+    spec["components"]["schemas"]["PostalAddress"]["properties"].clear()
+    Exporter.generate_schema(models.PostalAddress)["properties"].clear()
+
+    again = Exporter.to_openapi()
+    assert again["paths"] == {}
+    assert "country" in again["components"]["schemas"]["PostalAddress"]["properties"]
+    assert "country" in Exporter.generate_schema(models.PostalAddress)["properties"]
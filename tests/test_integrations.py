@@ -37,17 +37,7 @@ def test_dataclass_to_pydantic_conversion():
 # FastAPI Integration Test
 app = FastAPI()
 
-@app.post("/test-parse")
-async def route_test_endpoint(msg=Depends(get_openpurse_message)):
-    return {"status": "success", "msg_id": msg.message_id, "type": type(msg).__name__}
-
-def test_fastapi_dependency_parsing():
-    """
-    Verifies that the FastAPI dependency correctly parses XML into a Pydantic model.
-    """
-    client = TestClient(app)
-    
-    valid_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+VALID_PACS008_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 <Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.13">
     <FIToFICstmrCdtTrf>
         <GrpHdr>
@@ -84,7 +74,18 @@ def test_fastapi_dependency_parsing():
     </FIToFICstmrCdtTrf>
 </Document>
 """
-    response = client.post("/test-parse", content=valid_xml)
+
+@app.post("/test-parse")
+async def route_test_endpoint(msg=Depends(get_openpurse_message)):
+    return {"status": "success", "msg_id": msg.message_id, "type": type(msg).__name__}
+
+def test_fastapi_dependency_parsing():
+    """
+    Verifies that the FastAPI dependency correctly parses XML into a Pydantic model.
+    """
+    client = TestClient(app)
+    
+    response = client.post("/test-parse", content=VALID_PACS008_XML)
     assert response.status_code == 200
     assert response.json() == {
         "status": "success", 
@@ -111,3 +112,54 @@ def test_fastapi_dependency_failure_invalid_xml():
     response = client.post("/test-parse", content=invalid_xml)
     assert response.status_code == 422
     assert "Schema validation failed" in response.json()["detail"]["message"]
+
+
+@pytest.fixture
+def parser_constructions(monkeypatch):
+    """
+    Records the payload of every OpenPurseParser built while the test runs.
+    """
+    from openpurse.parser import OpenPurseParser
+
+    constructed = []
+    original_init = OpenPurseParser.__init__
+
+    def counting_init(self, message_data):
+        constructed.append(message_data)
+        original_init(self, message_data)
+
+    monkeypatch.setattr(OpenPurseParser, "__init__", counting_init)
+    return constructed
+
+
+def test_fastapi_dependency_parses_xml_once(parser_constructions):
+    """
+    Verifies that schema validation and extraction share a single XML parse.
+    """
+    response = TestClient(app).post("/test-parse", content=VALID_PACS008_XML)
+
+    assert response.status_code == 200
+    assert len(parser_constructions) == 1
+
+
+def test_fastapi_dependency_rejects_invalid_mt_before_parsing(parser_constructions):
+    """
+    Verifies that MT bodies go through the MT block validator and are only parsed once valid.
+    """
+    response = TestClient(app).post("/test-parse", content=b"{1:F01BANKUS33AXXX0000000000}{4:\n:20:X\n-}")
+
+    assert response.status_code == 422
+    assert parser_constructions == []
+
+
+def test_fastapi_dependency_accepts_utf16_xml(parser_constructions):
+    """
+    Verifies that UTF-16 XML bodies (BOM plus NUL bytes) are routed as XML, not rejected.
+    """
+    utf16_body = VALID_PACS008_XML.decode("utf-8").replace('encoding="UTF-8"', 'encoding="UTF-16"')
+
+    response = TestClient(app).post("/test-parse", content=utf16_body.encode("utf-16"))
+
+    assert response.status_code == 200
+    assert response.json()["msg_id"] == "MSG_FASTAPI_001"
+    assert len(parser_constructions) == 1
@@ -77,3 +77,44 @@ def test_mt_validation_malformed_blocks():
     report = Validator.validate_schema(malformed)
     assert report.is_valid is False
     assert any(" structure" in err for err in report.errors)
+
+def test_mt_validation_block4_crlf_and_unterminated():
+    crlf_mt = (
+        "{1:F01BANKUS33AXXX0000000000}{2:I103RECVGB22XXXXN}{4:\r\n"
+        ":20:MSG12345\r\n"
+        ":32A:231024USD1000,50\r\n"
+        "-}"
+    ).encode("utf-8")
+    assert Validator.validate_schema(crlf_mt).is_valid is True
+
+    # Long unterminated bodies are rejected without regex backtracking
+    unterminated = (
+        "{1:F01BANKUS33AXXX0000000000}{2:I103RECVGB22XXXXN}{4:\n:20:X\n" + "-\n" * 50000
+    ).encode("utf-8")
+    report = Validator.validate_schema(unterminated)
+    assert report.is_valid is False
+    assert any("Block 4" in err for err in report.errors)
+
+@pytest.mark.parametrize(
+    "value_date, is_valid",
+    [
+        ("240229", True),   # 2024 leap day
+        ("000229", True),   # %y pivots 00 to 2000, a leap year
+        ("230229", False),  # 2023 is not a leap year
+        ("230431", False),  # April has 30 days
+        ("231000", False),
+        ("230024", False),
+        ("2310A4", False),
+    ],
+)
+def test_mt_validation_32a_calendar_dates(value_date, is_valid):
+    mt = (
+        "{1:F01BANKUS33AXXX0000000000}{2:I103RECVGB22XXXXN}{4:\n"
+        ":20:MSG12345\n"
+        f":32A:{value_date}USD1000,50\n"
+        "-}"
+    ).encode("utf-8")
+
+    report = Validator.validate_schema(mt)
+    assert report.is_valid is is_valid
+    assert any("Invalid date in Field 32A" in err for err in report.errors) is not is_valid
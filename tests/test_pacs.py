@@ -96,8 +96,8 @@ def test_parse_pacs_009_financial_institution_credit_transfer():
     assert tx["debtor"] == "BOFUS33"
     assert tx["creditor"] == "CHASUS33"
 
-def test_pacs_edge_cases():
-    """Test extracting detailed fields from heavily malformed PACS.009 and PACS.004 messages."""
+def test_pacs_004_edge_cases():
+    """Test extracting detailed fields from a heavily malformed PACS.004 message."""
     missing_pacs_004 = b"""<?xml version="1.0" encoding="UTF-8"?>
     <Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.004.001.09">
         <PmtRtr>
@@ -115,6 +115,9 @@ def test_pacs_edge_cases():
     # No transactions should be parsed
     assert len(parsed.transactions) == 0
 
+
+def test_pacs_009_edge_cases():
+    """Test extracting detailed fields from a heavily malformed PACS.009 message."""
     missing_pacs_009 = b"""<?xml version="1.0" encoding="UTF-8"?>
     <Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.009.001.08">
         <FICdtTrf>
@@ -84,3 +84,17 @@ def test_reconciler_edge_cases():
     assert Reconciler.is_match(msg7, msg8) is True
     msg9 = MessageBuilder.build("camt.054", end_to_end_id="TX123", amount="FIFTY", currency="EUR")
     assert Reconciler.is_match(msg7, msg9) is False
+
+
+def test_trace_lifecycle_follows_chained_identifiers():
+    # Each hop shares a different identifier with the next, so the chain is only
+    # discoverable transitively: UETR -> EndToEndId -> MsgId reference.
+    payment = MessageBuilder.build("pacs.008", message_id="PAY_001", uetr="UETR-1")
+    booking = MessageBuilder.build("camt.054", uetr="UETR-1", end_to_end_id="E2E-1")
+    statement = MessageBuilder.build("camt.053", message_id="STMT_001", end_to_end_id="E2E-1")
+    status = MessageBuilder.build("pain.002", original_message_id="STMT_001")
+    noise = [MessageBuilder.build("pacs.008", end_to_end_id=f"OTHER-{i}") for i in range(50)]
+
+    timeline = Reconciler.trace_lifecycle(payment, noise + [status, statement, booking, payment])
+
+    assert timeline == [payment, booking, statement, status]
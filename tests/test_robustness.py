@@ -186,3 +186,30 @@ def test_parser_huge_values():
     parser = OpenPurseParser(xml)
     msg = parser.parse()
     assert msg.message_id == huge_id
+
+
+
+def test_parser_does_not_expand_dtd_entities():
+    """Entity declarations in an inbound DOCTYPE must never be expanded (XXE / entity bombs)."""
+    xml = b"""<?xml version="1.0"?>
+<!DOCTYPE Document [<!ENTITY boom "EXPANDED">]>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08">
+    <FIToFICstmrCdtTrf><GrpHdr><MsgId>&boom;</MsgId></GrpHdr></FIToFICstmrCdtTrf>
+</Document>"""
+    msg = OpenPurseParser(xml).parse()
+    assert "EXPANDED" not in (msg.message_id or "")
+
+
+def test_xml_parser_is_reused_per_thread():
+    """Each thread parses with its own long-lived XMLParser, so parses never queue on one lock."""
+    import threading
+
+    from openpurse.parser import xml_parser
+
+    assert xml_parser() is xml_parser()
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(xml_parser()))
+    worker.start()
+    worker.join()
+    assert other[0] is not xml_parser()
@@ -1,3 +1,6 @@
+from decimal import Decimal
+from enum import Enum
+
 import pytest
 
 from openpurse.models import Camt053Message, PaymentMessage
@@ -102,7 +105,7 @@ def test_translate_900_910_camt054():
 
     mx_bytes = Translator.to_mx(msg, "camt.054")
     assert b"<CdtDbtInd>DBIT</CdtDbtInd>" in mx_bytes
-    assert b'<Amt Ccy="EUR">50.0</Amt>' in mx_bytes  # abs amt
+    assert b'<Amt Ccy="EUR">50.00</Amt>' in mx_bytes  # abs amt, precision preserved
 
     msg.amount = "100.00"
     msg.creditor_name = "Bob (Credited)"
@@ -112,6 +115,27 @@ def test_translate_900_910_camt054():
     mx_bytes_crdt = Translator.to_mx(msg, "camt.054")
     assert b"<CdtDbtInd>CRDT</CdtDbtInd>" in mx_bytes_crdt
 
+    # Amounts beyond float precision must survive untouched
+    msg.amount = "-12345678901234567.89"
+    mx_bytes_big = Translator.to_mx(msg, "camt.054")
+    assert b'<Amt Ccy="EUR">12345678901234567.89</Amt>' in mx_bytes_big
+    assert b"<CdtDbtInd>DBIT</CdtDbtInd>" in mx_bytes_big
+
+    # Only amounts above zero are credits; zero (however written) maps to DBIT
+    for zero in ("0", "0.00", "+0.00", "-0.00", Decimal("0.00"), Decimal("-0.00")):
+        msg.amount = zero
+        assert b"<CdtDbtInd>DBIT</CdtDbtInd>" in Translator.to_mx(msg, "camt.054"), zero
+
+    # Non-string amounts are read through str() like the string forms
+    msg.amount = Decimal("12.50")
+    mx_bytes = Translator.to_mx(msg, "camt.054")
+    assert b"<CdtDbtInd>CRDT</CdtDbtInd>" in mx_bytes
+    assert b'<Amt Ccy="EUR">12.50</Amt>' in mx_bytes
+    msg.amount = -7
+    mx_bytes = Translator.to_mx(msg, "camt.054")
+    assert b"<CdtDbtInd>DBIT</CdtDbtInd>" in mx_bytes
+    assert b'<Amt Ccy="EUR">7</Amt>' in mx_bytes
+
 
 def test_translate_940_camt053():
     msg = Camt053Message(
@@ -256,3 +280,121 @@ def test_translate_942_950():
     assert b"D50,00NTRFTXN2" in mt_950_bytes
     assert b":62F:C" in mt_950_bytes
     assert b":86:" not in mt_950_bytes  # MT950 omits remittance information block
+
+
+def test_translate_mt_uses_current_date():
+    from datetime import datetime
+
+    msg = PaymentMessage(message_id="DATED", amount="1.00", currency="EUR")
+    first = Translator.to_mt(msg, "103")
+    second = Translator.to_mt(msg, "202")
+
+    today = datetime.now().strftime("%y%m%d").encode()
+    assert b":32A:" + today + b"EUR1,00" in first
+    assert b":32A:" + today + b"EUR1,00" in second
+
+
+def test_translate_generates_valid_default_uetr():
+    from openpurse.validator import Validator
+
+    msg = PaymentMessage(message_id="NOUETR", amount="10.00", currency="EUR")
+
+    mt_roundtrip = OpenPurseParser(Translator.to_mt(msg, "103")).parse()
+    mx_roundtrip = OpenPurseParser(Translator.to_mx(msg, "pacs.008")).parse()
+
+    assert Validator._validate_uetr(mt_roundtrip.uetr) is None
+    assert Validator._validate_uetr(mx_roundtrip.uetr) is None
+    assert mt_roundtrip.uetr != mx_roundtrip.uetr
+
+
+def test_translate_to_mx_escapes_xml_metacharacters():
+    from openpurse.models import PostalAddress
+
+    msg = PaymentMessage(
+        message_id="ESC<1>",
+        end_to_end_id="E2E&1",
+        amount="10.00",
+        currency="EUR",
+        debtor_name='Smith & "Sons"',
+        creditor_name="O'Brien <Ltd>",
+        debtor_address=PostalAddress(town_name="A&B", address_lines=["<Line>"]),
+    )
+
+    mx_bytes = Translator.to_mx(msg, "pacs.008")
+    assert b'<Nm>Smith &amp; "Sons"</Nm>' in mx_bytes
+    assert b"<TwnNm>A&amp;B</TwnNm>" in mx_bytes
+
+    roundtrip = OpenPurseParser(mx_bytes).parse()
+    assert roundtrip.message_id == "ESC<1>"
+    assert roundtrip.end_to_end_id == "E2E&1"
+    assert roundtrip.debtor_name == 'Smith & "Sons"'
+    assert roundtrip.creditor_name == "O'Brien <Ltd>"
+    assert roundtrip.debtor_address.address_lines == ["<Line>"]
+
+
+def test_translate_statement_entry_amounts_use_decimal_comma():
+    msg = Camt053Message(
+        message_id="STMTAMT",
+        amount="10",
+        currency="EUR",
+        entries=[
+            {"reference": "WHOLE", "amount": "250", "credit_debit_indicator": "CRDT"},
+            {"reference": "INTEGER", "amount": 250, "credit_debit_indicator": "CRDT"},
+            {"reference": "MISSING", "amount": None, "credit_debit_indicator": "DBIT"},
+            {"reference": "ZERO", "amount": 0, "credit_debit_indicator": "DBIT"},
+            {"reference": "EMPTY", "amount": "", "credit_debit_indicator": "DBIT"},
+            {"reference": "ABSENT", "credit_debit_indicator": "DBIT"},
+        ],
+    )
+    mt_bytes = Translator.to_mt(msg, "940")
+    assert b":60F:C" in mt_bytes and b"EUR10,\n" in mt_bytes
+
+    # Whole amounts, str or int, carry the mandatory trailing decimal comma
+    for mt_type in ("940", "942", "950"):
+        mt_bytes = Translator.to_mt(msg, mt_type)
+        assert b"C250,NTRFWHOLE" in mt_bytes, mt_type
+        assert b"C250,NTRFINTEGER" in mt_bytes, mt_type
+        # Missing or falsy amounts fall back to 0,00 rather than "None" or an empty field
+        for ref in (b"MISSING", b"ZERO", b"EMPTY", b"ABSENT"):
+            assert b"D0,00NTRF" + ref in mt_bytes, (mt_type, ref)
+
+
+@pytest.mark.parametrize("mx_type", ["pacs.008", "pacs.009"])
+def test_translate_to_mx_accepts_non_string_amount_and_ids(mx_type):
+    msg = PaymentMessage(
+        message_id=12345,
+        end_to_end_id=678,
+        amount=Decimal("10.00"),
+        currency="EUR",
+        sender_bic="BANKDEFFXXX",
+        receiver_bic="BANKGB22XXX",
+    )
+
+    mx_bytes = Translator.to_mx(msg, mx_type)
+    assert b"<MsgId>12345</MsgId>" in mx_bytes
+    assert b"<EndToEndId>678</EndToEndId>" in mx_bytes
+    assert b'<IntrBkSttlmAmt Ccy="EUR">10.00</IntrBkSttlmAmt>' in mx_bytes
+
+
+class _Code(str, Enum):
+    EUR = "EUR"
+    SENDER = "BANKDEFFXXX"
+    RECEIVER = "BANKGB22XXX"
+
+
+def test_translate_accepts_str_subclass_codes():
+    msg = PaymentMessage(
+        message_id="ENUM1",
+        amount="10.00",
+        currency=_Code.EUR,
+        sender_bic=_Code.SENDER,
+        receiver_bic=_Code.RECEIVER,
+    )
+
+    mt_bytes = Translator.to_mt(msg, "103")
+    assert b"{1:F01BANKDEFFXXXX" in mt_bytes
+    assert b"{2:I103BANKGB22XXXX" in mt_bytes
+
+    mx_bytes = Translator.to_mx(msg, "pacs.008")
+    assert b'<IntrBkSttlmAmt Ccy="EUR">10.00</IntrBkSttlmAmt>' in mx_bytes
+    assert b"<BICFI>BANKDEFFXXX</BICFI>" in mx_bytes
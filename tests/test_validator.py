@@ -145,3 +145,96 @@ def test_extreme_corruption_ibans():
             assert report.is_valid is False, f"Failed to catch corrupted IBAN: {bad_iban}"
             assert "Invalid IBAN" in report.errors[0]
 
+
+def test_iban_mod97_matches_big_integer_reference():
+    """The single-pass scan must agree with the naive big-integer computation."""
+    for iban in ["GB90MIDL40051522334455", "FR1420041010050500013M02606", "ZZ00ABCXYZ0123456789"]:
+        rearranged = iban[4:] + iban[:4]
+        reference = int("".join(str(int(ch, 36)) for ch in rearranged)) % 97
+        assert Validator._iban_mod97(iban) == reference
+        assert Validator._iban_mod97(f"{iban[:4]} {iban[4:8]}-{iban[8:]}") == reference
+
+    # Shape violations are reported as None rather than a remainder
+    for bad in ["G190MIDL40051522334455", "GBX0MIDL40051522334455", "GB90MIDL", "GB90MID\nL4005152233"]:
+        assert Validator._iban_mod97(bad) is None
+
+
+def test_validate_batch_preserves_order():
+    good = MessageBuilder.build("pacs.008", debtor_account="GB90MIDL40051522334455")
+    bad = MessageBuilder.build("pacs.008", debtor_account="GB99MIDL40051522334455")
+    reports = Validator.validate_batch([good, bad, good, PaymentMessage(sender_bic="BANK")])
+
+    assert [r.is_valid for r in reports] == [True, False, True, False]
+    assert "Invalid IBAN checksum" in reports[1].errors[0]
+    assert Validator.validate_batch([]) == []
+
+
+def test_iban_country_structure():
+    valid = [
+        "DE89370400440532013000",
+        "NL91ABNA0417164300",
+        "IT60X0542811101000000123456",
+        "MT84MALT011000012345MTLCAST001S",
+        "NO9386011117947",
+    ]
+    for iban in valid:
+        assert Validator._validate_iban_checksum(iban) is None, iban
+
+    # Wrong length for the country, even though the generic envelope allows it
+    short = Validator._validate_iban_checksum("GB90MIDL4005152233445")
+    assert short is not None and "GB IBANs have 22" in short
+
+    # Letter where the GB registry requires a digit
+    wrong_class = Validator._validate_iban_checksum("GB29NWBK6016133192681O")
+    assert wrong_class is not None and "BBAN structure" in wrong_class
+
+
+def test_amount_and_currency_type_handling():
+    from decimal import Decimal
+
+    typed = PaymentMessage(amount=Decimal("10.00"), currency="EUR")
+    assert Validator.validate(typed).is_valid is True
+
+    # Non-ASCII letters are not ISO 4217 codes
+    report = Validator.validate(PaymentMessage(amount="10.00", currency="ÉUR"))
+    assert report.is_valid is False
+    assert "3 alphabetical characters" in report.errors[0]
+
+
+def test_register_known_bics():
+    # Directory entries are trusted even when they would fail the structural check
+    try:
+        Validator.register_known_bics(["BANKUS33XXX", " TEST1234 \n"])
+        assert Validator.validate(PaymentMessage(sender_bic="TEST1234")).is_valid is True
+        assert Validator.validate(PaymentMessage(sender_bic="BANK")).is_valid is False
+    finally:
+        Validator.register_known_bics([])
+    assert Validator.validate(PaymentMessage(sender_bic="TEST1234")).is_valid is False
+
+
+def test_iban_embedded_line_breaks_rejected_by_format_scan():
+    # Line breaks are not separators: the format scan alone must reject them
+    for iban in ["GB90MIDL4005\n1522334455", "GB90MIDL4005\r\n1522334455", "GB90MIDL4005152233445\r5"]:
+        err = Validator._validate_iban_checksum(iban)
+        assert err is not None and err.startswith("Invalid IBAN format")
+
+
+def test_bban_structure_lookup():
+    assert Validator.bban_structure("GB") == (22, ((4, 8, "a"), (8, 22, "n")))
+    assert Validator.bban_structure("ZZ") is None
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b"  <Document/>", "xml"),
+        (b"{1:F01BANKUS33XXX0000000000}", "mt"),
+        ("<Document/>".encode("utf-16"), "xml"),
+        ("<Document/>".encode("utf-16-be"), "xml"),
+        (b"\xef\xbb\xbf<Document/>", "xml"),
+        (b"not a message", None),
+        (b"", None),
+    ],
+)
+def test_detect_format(raw, expected):
+    assert Validator.detect_format(raw) == expected
@@ -106,3 +106,63 @@ def test_writer_pain001_roundtrip():
     assert flat.get("creditor_name") == original.creditor_name
     assert flat.get("sender_bic") == original.sender_bic
     assert flat.get("receiver_bic") == original.receiver_bic
+
+
+def test_writer_declares_namespace_once_on_root():
+    """
+    Every element is built directly into the Document tree, so the target namespace is
+    declared once on the root and inherited by the whole tree (no re-declared subtrees).
+    """
+    address = PostalAddress(country="GB", town_name="London", address_lines=["Line 1"])
+    message = Pacs008Message(
+        message_id="MSG-1",
+        sender_bic="BANKGB22",
+        end_to_end_id="E2E-1",
+        amount="1.00",
+        currency="EUR",
+        debtor_name="Debtor",
+        debtor_address=address,
+        creditor_name="Creditor",
+    )
+
+    for schema in ("pacs.008.001.08", "pain.001.001.09"):
+        namespace = f"urn:iso:std:iso:20022:tech:xsd:{schema}"
+        xml_bytes = XMLWriter(schema=schema).to_xml(message)
+
+        assert xml_bytes.count(b"xmlns") == 1
+        root = etree.fromstring(xml_bytes)
+        assert root.nsmap == {None: namespace}
+        for element in root.iter():
+            assert etree.QName(element).namespace == namespace
+            assert element.nsmap == {None: namespace}
+
+    root = etree.fromstring(XMLWriter(schema="pacs.008.001.08").to_xml(message))
+    assert [etree.QName(el).localname for el in root] == ["FIToFICstmrCdtTrf"]
+    assert [etree.QName(el).localname for el in root[0]] == ["GrpHdr", "CdtTrfTxInf"]
+    assert [etree.QName(el).localname for el in root[0][1]] == [
+        "PmtId", "IntrBkSttlmAmt", "Dbtr", "Cdtr"
+    ]
+
+
+def test_writer_pretty_print_is_opt_in():
+    message = Pacs008Message(message_id="MSG-1", end_to_end_id="E2E-1", amount="1.00", currency="EUR")
+
+    compact = XMLWriter(schema="pacs.008.001.08").to_xml(message)
+    pretty = XMLWriter(schema="pacs.008.001.08", pretty=True).to_xml(message)
+
+    assert b"\n  <" not in compact
+    assert b"\n  <FIToFICstmrCdtTrf>" in pretty
+    assert etree.tostring(etree.fromstring(compact)) == etree.tostring(
+        etree.fromstring(pretty, etree.XMLParser(remove_blank_text=True))
+    )
+
+
+def test_writer_canonical_output():
+    message = Pacs008Message(message_id="MSG-1", debtor_name="A & B", amount="1.00", currency="EUR")
+
+    canonical = XMLWriter(schema="pacs.008.001.08", pretty=True).to_xml(message, canonical=True)
+    regular = XMLWriter(schema="pacs.008.001.08").to_xml(message)
+
+    assert not canonical.startswith(b"<?xml")
+    assert b"\n" not in canonical
+    assert canonical == etree.tostring(etree.fromstring(regular), method="c14n2")
@@ -2,11 +2,7 @@ import pytest
 from openpurse.validator import Validator
 from openpurse.parser import OpenPurseParser
 
-def test_pacs008_v13_xsd_validation_success():
-    """
-    Tests that a valid pacs.008.001.13 XML passes strict XSD validation.
-    """
-    valid_xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+_VALID_PACS008_V13 = b"""<?xml version="1.0" encoding="UTF-8"?>
 <Document xmlns="urn:iso:std:iso:20022:tech:xsd:pacs.008.001.13">
     <FIToFICstmrCdtTrf>
         <GrpHdr>
@@ -43,7 +39,21 @@ def test_pacs008_v13_xsd_validation_success():
     </FIToFICstmrCdtTrf>
 </Document>
 """
-    report = Validator.validate_schema(valid_xml)
+
+
+def test_pacs008_v13_xsd_validation_success():
+    """
+    Tests that a valid pacs.008.001.13 XML passes strict XSD validation.
+    """
+    report = Validator.validate_schema(_VALID_PACS008_V13)
+    assert report.is_valid is True, f"Validation failed with errors: {report.errors}"
+
+def test_xsd_validation_routes_utf16_xml():
+    """
+    Tests that UTF-16 XML (BOM plus NUL bytes) is routed to XSD validation, not rejected.
+    """
+    utf16_xml = _VALID_PACS008_V13.decode("utf-8").replace('encoding="UTF-8"', 'encoding="UTF-16"')
+    report = Validator.validate_schema(utf16_xml.encode("utf-16"))
     assert report.is_valid is True, f"Validation failed with errors: {report.errors}"
 
 def test_pacs008_v13_xsd_validation_failure_missing_element():